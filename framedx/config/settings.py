@@ -10,6 +10,7 @@ DEFAULT_SETTINGS = {
     "matching_window": 10,
     "pre_context_seconds": 5,
     "frame_interval": 2.0,
+    "use_cuda": False,
     "language": "auto",
     "use_llm_correction": False,
     "anthropic_api_key": "",
@@ -41,5 +42,8 @@ def load_settings() -> dict:
 
 def save_settings(settings: dict) -> None:
     path = _config_path()
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(settings, f, indent=2, ensure_ascii=False)
+    # Write to a sibling temp file and swap it in atomically, so a crash
+    # mid-write never leaves a truncated settings.json behind.
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(settings, indent=2, ensure_ascii=False, default=str), encoding="utf-8")
+    os.replace(tmp, path)
@@ -35,8 +35,7 @@ _MODEL = genanki.Model(
 
 def _stable_id(text: str) -> int:
     """Generate a stable integer ID from a string."""
-    h = hashlib.md5(text.encode()).hexdigest()
-    return int(h[:8], 16)
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=4).digest(), "big")
 
 
 def export_deck(
@@ -76,6 +75,8 @@ def export_deck(
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
+    # genanki streams media from disk in chunks into an uncompressed (ZIP_STORED)
+    # archive, so PNGs are neither held fully in memory nor deflated twice.
     package = genanki.Package(deck)
     package.media_files = media_files
     package.write_to_file(str(output_file))
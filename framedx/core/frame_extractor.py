@@ -1,13 +1,51 @@
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 import cv2
 import numpy as np
-from skimage.metrics import structural_similarity as ssim
+
+try:
+    from numba import config as _numba_config, njit, prange
+
+    # TBB's worker pool, once driven from a job thread, keeps the interpreter
+    # from exiting; prefer OpenMP/workqueue (NUMBA_THREADING_LAYER still wins)
+    _numba_config.THREADING_LAYER_PRIORITY = ["omp", "workqueue", "tbb"]
+except ImportError:  # optional: numpy fallback below
+    njit = None
 
 # Width to downscale to for SSIM comparison (much faster, same accuracy for change detection)
 _COMPARE_WIDTH = 320
 
+# SSIM constants (Wang et al. 2004): 11x11 Gaussian window, sigma 1.5, 8-bit dynamic range
+_SSIM_C1 = (0.01 * 255) ** 2
+_SSIM_C2 = (0.03 * 255) ** 2
+_SSIM_KERNEL = cv2.getGaussianKernel(11, 1.5, cv2.CV_32F)
+
+# Background PNG encoders; OpenCV releases the GIL while encoding, so these scale across cores
+_WRITE_WORKERS = os.cpu_count() or 2
+_PNG_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 3]
+
+# Hamming distance between perceptual hashes below which SSIM is skipped, at
+# the default 0.85 threshold; stricter thresholds shrink it to 0 (no skip).
+# The hash ignores brightness and contrast, so a skip also needs a similar
+# mean intensity, and flat frames (std below the floor) are always scored.
+_PHASH_SKIP_DISTANCE = 6
+_PHASH_MAX_MEAN_SHIFT = 4.0
+_PHASH_MIN_STD = 10.0
+
+# Width of the cheap first-pass SSIM thumbnail, and how far below/above the
+# SSIM threshold a thumbnail score must fall to decide without the full-size
+# SSIM. Thumbnail scores run well below full-size ones on busy content, so
+# the low margin is wide. At the 0.85 default the band is (0.50, 0.98).
+_PREVIEW_WIDTH = 64
+_PREVIEW_MARGINS = (0.35, 0.13)
+
+# Frames shipped to the GPU per SSIM batch when use_cuda is enabled
+_CUDA_BATCH = 32
+
 
 @dataclass
 class DetectedSlide:
@@ -16,15 +54,276 @@ class DetectedSlide:
     image_path: str
 
 
-def _downscale_gray(frame: np.ndarray) -> np.ndarray:
-    """Convert to grayscale and downscale for fast SSIM comparison."""
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    h, w = gray.shape
-    if w > _COMPARE_WIDTH:
-        scale = _COMPARE_WIDTH / w
-        new_h = int(h * scale)
-        gray = cv2.resize(gray, (_COMPARE_WIDTH, new_h), interpolation=cv2.INTER_AREA)
-    return gray
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _ssim_reduce(mu1, mu2, sigma1_sq, sigma2_sq, blur_ab, c1, c2):
+        """Fused SSIM map + mean over precomputed local statistics."""
+        h, w = mu1.shape
+        total = 0.0
+        for y in prange(h):
+            row = 0.0
+            for x in range(w):
+                m1 = mu1[y, x]
+                m2 = mu2[y, x]
+                m12 = m1 * m2
+                num = (2 * m12 + c1) * (2 * (blur_ab[y, x] - m12) + c2)
+                den = (m1 * m1 + m2 * m2 + c1) * (sigma1_sq[y, x] + sigma2_sq[y, x] + c2)
+                row += num / den
+            total += row
+        return total / (h * w)
+else:
+    _ssim_reduce = None
+
+
+def _blur(img: np.ndarray, dst: np.ndarray) -> np.ndarray:
+    """Separable Gaussian window used for all SSIM local statistics."""
+    return cv2.sepFilter2D(img, cv2.CV_32F, _SSIM_KERNEL, _SSIM_KERNEL, dst=dst)
+
+
+class _SsimWorkspace:
+    """Preallocated float32 buffers for SSIM on frames of one fixed shape.
+
+    Per-frame stats (image, local mean, local variance) are computed once and
+    reused, so each new comparison only needs the cross term. Two stat slots
+    alternate, so the stats returned by the previous stats() call stay valid
+    for exactly one more call.
+    """
+
+    def __init__(self, shape: tuple[int, int]):
+        self._slots = [tuple(np.empty(shape, np.float32) for _ in range(3)) for _ in range(2)]
+        self._next_slot = 0
+        self._ab = np.empty(shape, np.float32)
+        self._sigma12 = np.empty(shape, np.float32)
+        self._num = np.empty(shape, np.float32)
+        self._den = np.empty(shape, np.float32)
+        self._tmp = np.empty(shape, np.float32)
+
+    def stats(self, gray: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        img, mu, sigma_sq = self._slots[self._next_slot]
+        self._next_slot ^= 1
+        np.copyto(img, gray)
+        _blur(img, mu)
+        cv2.multiply(img, img, dst=self._tmp)
+        _blur(self._tmp, sigma_sq)
+        cv2.multiply(mu, mu, dst=self._tmp)
+        cv2.subtract(sigma_sq, self._tmp, dst=sigma_sq)
+        return img, mu, sigma_sq
+
+    def score(self, a_stats, b_stats) -> float:
+        a, mu1, sigma1_sq = a_stats
+        b, mu2, sigma2_sq = b_stats
+        ab, sigma12, num, den, tmp = self._ab, self._sigma12, self._num, self._den, self._tmp
+
+        cv2.multiply(a, b, dst=ab)
+        _blur(ab, sigma12)
+        if _ssim_reduce is not None:
+            return float(_ssim_reduce(mu1, mu2, sigma1_sq, sigma2_sq, sigma12, _SSIM_C1, _SSIM_C2))
+
+        cv2.multiply(mu1, mu2, dst=ab)  # ab now holds mu1*mu2
+        cv2.subtract(sigma12, ab, dst=sigma12)
+
+        # num = (2*mu1*mu2 + C1) * (2*sigma12 + C2)
+        np.multiply(ab, 2, out=num)
+        num += _SSIM_C1
+        np.multiply(sigma12, 2, out=tmp)
+        tmp += _SSIM_C2
+        num *= tmp
+
+        # den = (mu1^2 + mu2^2 + C1) * (sigma1^2 + sigma2^2 + C2)
+        np.multiply(mu1, mu1, out=den)
+        np.multiply(mu2, mu2, out=tmp)
+        den += tmp
+        den += _SSIM_C1
+        np.add(sigma1_sq, sigma2_sq, out=tmp)
+        tmp += _SSIM_C2
+        den *= tmp
+
+        num /= den
+        return float(cv2.mean(num)[0])
+
+
+def _fast_ssim(a: np.ndarray, b: np.ndarray) -> float:
+    """Mean SSIM of two grayscale uint8 images using OpenCV separable filters."""
+    ws = _SsimWorkspace(a.shape)
+    return ws.score(ws.stats(a), ws.stats(b))
+
+
+def _scan_size(width: int, height: int) -> tuple[int, int]:
+    """Size of the downscaled gray frames emitted by the ffmpeg scan pass."""
+    if width <= _COMPARE_WIDTH:
+        return width, height
+    new_h = max(2, int(height * _COMPARE_WIDTH / width) // 2 * 2)
+    return _COMPARE_WIDTH, new_h
+
+
+def _open_scan_stream(video_path: str, frame_interval: float, size: tuple[int, int]):
+    """Spawn ffmpeg decoding one small grayscale frame per interval to stdout."""
+    w, h = size
+    cmd = [
+        "ffmpeg", "-nostdin", "-v", "error",
+        # Non-reference frames (typically B-frames) are never needed for a sample
+        # every few seconds; skipping them in the decoder cuts most decode work.
+        "-skip_frame", "noref",
+        "-i", video_path,
+        "-an",
+        # Sample first, then scale and convert in one swscale pass that only
+        # reads the luma plane — no full-resolution color conversion happens.
+        # round=up makes sample n the frame at exactly n * frame_interval (the
+        # default round=near lands half an interval later), which is the
+        # timestamp _read_scan_frames reports and save_slide seeks to.
+        "-vf", f"fps=1/{frame_interval}:round=up,scale={w}:{h}:flags=area,format=gray",
+        "-f", "rawvideo", "-pix_fmt", "gray",
+        "-",
+    ]
+    return subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+    )
+
+
+def _read_scan_frames(stream, size: tuple[int, int], frame_interval: float):
+    """Yield (timestamp, gray frame) from the raw ffmpeg scan stream."""
+    w, h = size
+    frame_bytes = w * h
+    sample_idx = 0
+    while True:
+        buf = stream.read(frame_bytes)
+        if len(buf) < frame_bytes:
+            return
+        yield sample_idx * frame_interval, np.frombuffer(buf, dtype=np.uint8).reshape(h, w)
+        sample_idx += 1
+
+
+def _phash(gray: np.ndarray) -> int:
+    """64-bit DCT perceptual hash of a grayscale frame."""
+    small = cv2.resize(gray, (32, 32), interpolation=cv2.INTER_AREA).astype(np.float32)
+    low = cv2.dct(small)[:8, :8]
+    return int.from_bytes(np.packbits(low > np.median(low)).tobytes(), "big")
+
+
+def _preview(small: np.ndarray) -> np.ndarray:
+    """Thumbnail of a scan frame for the cheap first-pass SSIM."""
+    h, w = small.shape
+    if w <= _PREVIEW_WIDTH:
+        return small
+    new_h = max(1, int(h * _PREVIEW_WIDTH / w))
+    return cv2.resize(small, (_PREVIEW_WIDTH, new_h), interpolation=cv2.INTER_AREA)
+
+
+def _score_frames_cpu(frames, ssim_threshold: float):
+    """Yield (timestamp, frame, SSIM vs previous frame or None) using OpenCV.
+
+    Textured frames whose perceptual hash and mean intensity are both close to
+    the previous frame's are treated as unchanged and yield None without
+    running SSIM. Other pairs are scored on thumbnails first; the full-size
+    SSIM only runs when the thumbnail score falls within _PREVIEW_MARGINS of
+    ssim_threshold.
+    """
+    low = ssim_threshold - _PREVIEW_MARGINS[0]
+    high = ssim_threshold + _PREVIEW_MARGINS[1]
+    skip_distance = min(_PHASH_SKIP_DISTANCE, round(_PHASH_SKIP_DISTANCE * (1.0 - ssim_threshold) / (1.0 - 0.85)))
+    workspace = preview_workspace = None
+    prev_small = None
+    prev_hash = 0
+    prev_mean = prev_std = 0.0
+    # Stats are only computed when the previous frame was actually compared
+    prev_stats = prev_preview_stats = None
+    for timestamp, small in frames:
+        h = _phash(small)
+        mean, std = (float(v[0, 0]) for v in cv2.meanStdDev(small))
+        stats = preview_stats = None
+        score = None
+        if prev_small is None:
+            workspace = _SsimWorkspace(small.shape)
+            preview_workspace = _SsimWorkspace(_preview(small).shape)
+        elif not (
+            (prev_hash ^ h).bit_count() < skip_distance
+            and abs(mean - prev_mean) < _PHASH_MAX_MEAN_SHIFT
+            and min(std, prev_std) >= _PHASH_MIN_STD
+        ):
+            if prev_preview_stats is None:
+                prev_preview_stats = preview_workspace.stats(_preview(prev_small))
+            preview_stats = preview_workspace.stats(_preview(small))
+            score = preview_workspace.score(prev_preview_stats, preview_stats)
+
+            if low <= score <= high:
+                if prev_stats is None:
+                    prev_stats = workspace.stats(prev_small)
+                stats = workspace.stats(small)
+                score = workspace.score(prev_stats, stats)
+        prev_small = small
+        prev_hash = h
+        prev_mean, prev_std = mean, std
+        prev_stats = stats
+        prev_preview_stats = preview_stats
+        yield timestamp, small, score
+
+
+def _cuda_device():
+    """Return a torch CUDA device, or None when torch/CUDA is unavailable."""
+    try:
+        import torch
+    except ImportError:
+        return None
+    if not torch.cuda.is_available():
+        return None
+    return torch.device("cuda")
+
+
+def _cuda_pair_ssim(frames: list[np.ndarray], device) -> np.ndarray:
+    """SSIM of each consecutive frame pair in one GPU batch (N frames -> N-1 scores)."""
+    import torch
+    import torch.nn.functional as F
+
+    kernel = torch.from_numpy(_SSIM_KERNEL.ravel()).to(device)
+    k_row = kernel.view(1, 1, 1, -1)
+    k_col = kernel.view(1, 1, -1, 1)
+    pad = kernel.numel() // 2
+
+    def blur(t):
+        # Reflect padding matches OpenCV's default BORDER_REFLECT_101 on the CPU path
+        t = F.conv2d(F.pad(t, (pad, pad, 0, 0), mode="reflect"), k_row)
+        return F.conv2d(F.pad(t, (0, 0, pad, pad), mode="reflect"), k_col)
+
+    with torch.no_grad():
+        x = torch.from_numpy(np.stack(frames)).to(device).float().unsqueeze(1)
+        mu = blur(x)
+        sigma_sq = blur(x * x) - mu * mu
+        mu1, mu2 = mu[:-1], mu[1:]
+        mu1_mu2 = mu1 * mu2
+        sigma12 = blur(x[:-1] * x[1:]) - mu1_mu2
+        num = (2 * mu1_mu2 + _SSIM_C1) * (2 * sigma12 + _SSIM_C2)
+        den = (mu1 * mu1 + mu2 * mu2 + _SSIM_C1) * (sigma_sq[:-1] + sigma_sq[1:] + _SSIM_C2)
+        return (num / den).mean(dim=(1, 2, 3)).cpu().numpy()
+
+
+def _score_frames_cuda(frames, device):
+    """Same contract as _score_frames_cpu, but scores batches of frames on the GPU."""
+    # The last frame of each batch is carried into the next so no pair is skipped
+    carry: tuple[float, np.ndarray] | None = None
+    batch: list[tuple[float, np.ndarray]] = []
+
+    def flush():
+        group = ([carry] if carry is not None else []) + batch
+        if len(group) < 2:
+            scores = []
+        else:
+            scores = _cuda_pair_ssim([small for _, small in group], device)
+        if carry is None:
+            yield group[0][0], group[0][1], None
+        for (timestamp, small), score in zip(group[1:], scores):
+            yield timestamp, small, float(score)
+
+    for item in frames:
+        batch.append(item)
+        if len(batch) == _CUDA_BATCH:
+            yield from flush()
+            carry = batch[-1]
+            batch = []
+    if batch:
+        yield from flush()
 
 
 def extract_slides(
@@ -34,9 +333,17 @@ def extract_slides(
     frame_interval: float = 2.0,
     dedup_threshold: float = 0.95,
     progress_callback=None,
+    use_cuda: bool = False,
+    should_stop=None,
 ) -> list[DetectedSlide]:
     """Extract slide-change frames from a video using SSIM comparison.
 
+    Scanning runs on small grayscale frames decoded and scaled by ffmpeg; only
+    the detected slides are then decoded at full resolution via OpenCV.
+    With use_cuda, SSIM is computed in batches on the GPU via torch, falling
+    back to the CPU path when CUDA is unavailable. should_stop is polled once
+    per scanned frame; when it returns True the scan ends early.
+
     Returns a list of DetectedSlide with saved PNG paths and timestamps.
     """
     cap = cv2.VideoCapture(video_path)
@@ -46,73 +353,94 @@ def extract_slides(
     fps = cap.get(cv2.CAP_PROP_FPS)
     total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
     duration = total_frames / fps if fps > 0 else 0
-    frame_step = max(1, int(fps * frame_interval))
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    if width <= 0 or height <= 0:
+        cap.release()
+        raise RuntimeError(f"Cannot read frame size: {video_path}")
 
     slides_dir = Path(output_dir) / "slides"
     slides_dir.mkdir(parents=True, exist_ok=True)
 
+    # The scan runs over the low-res gray stream; each detected slide is then
+    # decoded at full resolution right away and its PNG encoded on a worker
+    # thread, so no full-res frames accumulate and encoding overlaps the scan.
+    scan_size = _scan_size(width, height)
+
+    device = _cuda_device() if use_cuda else None
+    if use_cuda and device is None and progress_callback:
+        progress_callback("CUDA not available — using CPU for slide detection")
+
+    slides: list[DetectedSlide] = []
+    writes = []
+    executor = ThreadPoolExecutor(max_workers=_WRITE_WORKERS)
+
+    def save_slide(ts: float):
+        cap.set(cv2.CAP_PROP_POS_MSEC, ts * 1000)
+        ret, frame = cap.read()
+        if not ret:
+            return
+        idx = len(slides)
+        path = str(slides_dir / f"slide_{idx:04d}_{ts:.1f}s.png")
+        writes.append(executor.submit(cv2.imwrite, path, frame, _PNG_PARAMS))
+        slides.append(DetectedSlide(timestamp=ts, frame_index=idx, image_path=path))
+
     prev_small = None
-    prev_frame = None
     prev_timestamp = 0.0
-    # Store (timestamp, full-res frame) for detected slides
-    candidates: list[tuple[float, np.ndarray]] = []
     # Keep downscaled gray of last candidate for dedup
     last_candidate_small: np.ndarray | None = None
 
-    frame_idx = 0
     last_pct = -1
 
-    while True:
-        # Sequential skip: grab without decoding, then retrieve only the frames we need
-        if frame_idx > 0:
-            skip = frame_step - 1
-            for _ in range(skip):
-                if not cap.grab():
-                    break
-            ret, frame = cap.read()
+    proc = _open_scan_stream(video_path, frame_interval, scan_size)
+    try:
+        frames = _read_scan_frames(proc.stdout, scan_size, frame_interval)
+        if device is not None:
+            scored = _score_frames_cuda(frames, device)
         else:
-            ret, frame = cap.read()
-
-        if not ret:
-            break
-
-        timestamp = frame_idx / fps if fps > 0 else 0
-        small = _downscale_gray(frame)
+            scored = _score_frames_cpu(frames, ssim_threshold)
 
-        if prev_small is not None:
-            score = ssim(prev_small, small)
-            if score < ssim_threshold:
+        stopped = False
+        for timestamp, small, score in scored:
+            if should_stop is not None and should_stop():
+                stopped = True
+                break
+            if score is not None and score < ssim_threshold:
                 # New slide detected — save the PREVIOUS frame (fully-loaded slide)
                 if last_candidate_small is not None:
-                    dup_score = ssim(last_candidate_small, prev_small)
+                    dup_score = _fast_ssim(last_candidate_small, prev_small)
                     if dup_score < dedup_threshold:
-                        candidates.append((prev_timestamp, prev_frame.copy()))
+                        save_slide(prev_timestamp)
                         last_candidate_small = prev_small
                 else:
-                    candidates.append((prev_timestamp, prev_frame.copy()))
+                    save_slide(prev_timestamp)
                     last_candidate_small = prev_small
 
-        prev_small = small
-        prev_frame = frame
-        prev_timestamp = timestamp
-
-        if progress_callback and duration > 0:
-            pct = min(100, int(timestamp / duration * 100))
-            if pct != last_pct:
-                progress_callback(f"Scanning frames: {pct}%")
-                last_pct = pct
-
-        frame_idx += frame_step
-
-    cap.release()
-
-    # Save candidate slides as PNGs (full resolution)
-    slides = []
-    for i, (ts, frame) in enumerate(candidates):
-        filename = f"slide_{i:04d}_{ts:.1f}s.png"
-        path = str(slides_dir / filename)
-        cv2.imwrite(path, frame)
-        slides.append(DetectedSlide(timestamp=ts, frame_index=i, image_path=path))
+            prev_small = small
+            prev_timestamp = timestamp
+
+            if progress_callback and duration > 0:
+                pct = min(100, int(timestamp / duration * 100))
+                if pct != last_pct:
+                    progress_callback(f"Scanning frames: {pct}%")
+                    last_pct = pct
+
+        # A stopped scan leaves ffmpeg to the kill below
+        if not stopped:
+            proc.stdout.close()
+            stderr = proc.stderr.read().decode(errors="replace")
+            if proc.wait() != 0:
+                raise RuntimeError(f"ffmpeg failed: {stderr[:500]}")
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        executor.shutdown(wait=True)
+        cap.release()
+
+    for write in writes:
+        if not write.result():
+            raise RuntimeError(f"Failed to write slide image in {slides_dir}")
 
     if progress_callback:
         progress_callback(f"Detected {len(slides)} slides")
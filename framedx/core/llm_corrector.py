@@ -1,4 +1,9 @@
-import anthropic
+import asyncio
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import anthropic
 
 SYSTEM_PROMPT = (
     "You are a medical transcription editor. Fix any medical terminology errors "
@@ -10,70 +15,109 @@ SYSTEM_PROMPT = (
 
 BATCH_SIZE = 10
 
+# "[N] corrected text" lines in the model's reply
+_NUMBERED_LINE = re.compile(r"^[ \t]*\[(\d+)\][ \t]*(.*)$", re.MULTILINE)
 
-def correct_transcripts(
-    texts: list[str],
-    api_key: str,
-    progress_callback=None,
-) -> list[str]:
-    """Send transcript texts to Claude API for medical term correction.
+# Max batches in flight at once; each request is network/LLM-latency bound
+MAX_CONCURRENT_REQUESTS = 8
 
-    Batches texts to minimize API calls.
-    """
-    if not api_key:
-        raise ValueError("Anthropic API key is required for LLM correction")
-
-    client = anthropic.Anthropic(api_key=api_key)
-    corrected = []
+# How often a running correction polls should_stop
+_STOP_POLL_SECONDS = 0.2
 
-    for batch_start in range(0, len(texts), BATCH_SIZE):
-        batch = texts[batch_start : batch_start + BATCH_SIZE]
 
-        # Build a numbered batch prompt
-        numbered = "\n".join(f"[{i+1}] {t}" for i, t in enumerate(batch))
-        user_prompt = (
-            f"Correct the medical terminology in each numbered segment below. "
-            f"Return each corrected segment on its own line, prefixed with the same number.\n\n"
-            f"{numbered}"
-        )
+async def _correct_batch(
+    client: "anthropic.AsyncAnthropic",
+    semaphore: asyncio.Semaphore,
+    batch: list[str],
+) -> list[str]:
+    """Correct one batch, falling back to the original texts on failure."""
+    # Build a numbered batch prompt
+    numbered = "\n".join(f"[{i+1}] {t}" for i, t in enumerate(batch))
+    user_prompt = (
+        f"Correct the medical terminology in each numbered segment below. "
+        f"Return each corrected segment on its own line, prefixed with the same number.\n\n"
+        f"{numbered}"
+    )
 
-        try:
-            response = client.messages.create(
+    try:
+        async with semaphore:
+            response = await client.messages.create(
                 model="claude-sonnet-4-20250514",
                 max_tokens=2048,
                 system=SYSTEM_PROMPT,
                 messages=[{"role": "user", "content": user_prompt}],
             )
+        response_text = response.content[0].text
+    except Exception:
+        # On any API error (after the client's own retries), keep originals
+        return list(batch)
+
+    # Parse numbered responses back
+    parsed = {int(m.group(1)): m.group(2).strip() for m in _NUMBERED_LINE.finditer(response_text)}
+
+    # Map back to batch order, falling back to original if parsing fails
+    return [parsed.get(i + 1, original) for i, original in enumerate(batch)]
+
+
+async def _stop_requested(should_stop) -> None:
+    while not should_stop():
+        await asyncio.sleep(_STOP_POLL_SECONDS)
 
-            response_text = response.content[0].text
-            lines = response_text.strip().split("\n")
-
-            # Parse numbered responses back
-            parsed = {}
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                # Try to extract [N] prefix
-                if line.startswith("["):
-                    bracket_end = line.find("]")
-                    if bracket_end > 0:
-                        try:
-                            num = int(line[1:bracket_end])
-                            parsed[num] = line[bracket_end + 1:].strip()
-                        except ValueError:
-                            pass
-
-            # Map back to batch order, falling back to original if parsing fails
-            for i, original in enumerate(batch):
-                corrected.append(parsed.get(i + 1, original))
-
-        except Exception:
-            # On any API error, keep originals
-            corrected.extend(batch)
 
+async def _correct_all(texts: list[str], api_key: str, progress_callback=None, should_stop=None) -> list[str]:
+    # Imported here: the SDK is slow to import and only needed when correcting
+    import anthropic
+
+    # The client retries 429/5xx and connection errors with backoff
+    client = anthropic.AsyncAnthropic(api_key=api_key, timeout=60.0, max_retries=3)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    done = 0
+
+    async def run(batch_start: int) -> list[str]:
+        nonlocal done
+        batch = texts[batch_start : batch_start + BATCH_SIZE]
+        result = await _correct_batch(client, semaphore, batch)
+        done += len(batch)
         if progress_callback:
-            done = min(batch_start + BATCH_SIZE, len(texts))
             progress_callback(f"LLM correction: {done}/{len(texts)} segments")
+        return result
+
+    try:
+        # gather() keeps results in submission order, so batches reassemble in place
+        batches = asyncio.gather(*(run(start) for start in range(0, len(texts), BATCH_SIZE)))
+        if should_stop is not None:
+            stop = asyncio.ensure_future(_stop_requested(should_stop))
+            await asyncio.wait({batches, stop}, return_when=asyncio.FIRST_COMPLETED)
+            stop.cancel()
+            if not batches.done():
+                # Stopped mid-correction: abandon the requests in flight
+                batches.cancel()
+                try:
+                    await batches
+                except asyncio.CancelledError:
+                    pass
+                return list(texts)
+        results = await batches
+    finally:
+        await client.close()
+
+    return [text for batch in results for text in batch]
+
+
+def correct_transcripts(
+    texts: list[str],
+    api_key: str,
+    progress_callback=None,
+    should_stop=None,
+) -> list[str]:
+    """Send transcript texts to Claude API for medical term correction.
+
+    Batches texts to minimize API calls and sends up to
+    MAX_CONCURRENT_REQUESTS batches concurrently. should_stop is polled
+    while requests are in flight; once it returns True the outstanding
+    requests are cancelled and the texts come back uncorrected.
+    """
+    if not api_key:
+        raise ValueError("Anthropic API key is required for LLM correction")
 
-    return corrected
+    return asyncio.run(_correct_all(texts, api_key, progress_callback, should_stop))
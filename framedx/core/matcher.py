@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 
+import numpy as np
+
 from framedx.core.frame_extractor import DetectedSlide
 from framedx.core.transcriber import TranscriptSegment
 
@@ -26,27 +28,39 @@ def match_slides_to_transcript(
     if not slides or not segments:
         return []
 
-    # Flatten all words with their timestamps for precise matching
-    all_words: list[tuple[str, float, float]] = []
+    # Concatenate per-segment word arrays for precise matching
+    words: list[str] = []
+    start_chunks: list[np.ndarray] = []
     for seg in segments:
         if seg.words:
-            for w in seg.words:
-                all_words.append((w.word, w.start, w.end))
+            words.extend(seg.words)
+            start_chunks.append(seg.word_starts)
         else:
             # Fallback: use segment-level timestamps
-            all_words.append((seg.text, seg.start, seg.end))
+            words.append(seg.text)
+            start_chunks.append(np.array([seg.start], dtype=np.float32))
+
+    # Sorted start times let each slide's window be found by binary search
+    start_arr = np.concatenate(start_chunks).astype(np.float64)
+    order = np.argsort(start_arr, kind="stable")
+    start_arr = start_arr[order]
+    words = [words[i] for i in order]
+
+    # One joined string plus per-word character offsets: each slide's text is
+    # then a single slice instead of a fresh join over its window.
+    joined = " ".join(words)
+    offsets = np.zeros(len(words) + 1, dtype=np.int64)
+    np.cumsum([len(w) + 1 for w in words], out=offsets[1:])
 
     pairs = []
     for slide in slides:
         window_start = max(0, slide.timestamp - pre_context_seconds)
         window_end = slide.timestamp + matching_window
 
-        matched_words = [
-            word for word, start, end in all_words
-            if start >= window_start and start <= window_end
-        ]
+        lo = int(np.searchsorted(start_arr, window_start, side="left"))
+        hi = int(np.searchsorted(start_arr, window_end, side="right"))
 
-        text = " ".join(matched_words).strip()
+        text = joined[offsets[lo]:offsets[hi] - 1].strip() if hi > lo else ""
 
         pairs.append(CardPair(
             image_path=slide.image_path,
@@ -1,16 +1,100 @@
 import os
 import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
-from PySide6.QtCore import QObject, QThread, Signal
+import numpy as np
+from PySide6.QtCore import QObject, QRunnable, Qt, Signal
 
 from framedx.core.frame_extractor import DetectedSlide, extract_slides
 from framedx.core.llm_corrector import correct_transcripts
 from framedx.core.matcher import CardPair, match_slides_to_transcript
-from framedx.core.transcriber import TranscriptSegment, transcribe, segments_to_srt, segments_to_text
+from framedx.core.transcriber import TranscriptSegment, load_model, transcribe, segments_to_srt, segments_to_text
+
+# Whisper expects 16 kHz mono audio
+_SAMPLE_RATE = 16000
+
+
+def _prefetch_audio(pool: ThreadPoolExecutor, video_paths: list[str], extract):
+    """Yield (index, path, audio future), decoding the next file's audio ahead.
+
+    While one video is being transcribed/scanned, ffmpeg is already decoding
+    the following one, hiding its startup and decode time from the batch.
+    """
+    upcoming = pool.submit(extract, video_paths[0]) if video_paths else None
+    try:
+        for i, video_path in enumerate(video_paths):
+            current = upcoming
+            upcoming = pool.submit(extract, video_paths[i + 1]) if i + 1 < len(video_paths) else None
+            yield i, video_path, current
+    finally:
+        # Closed early (cancel): don't start the queued decode, and let go of
+        # any audio it already produced
+        if upcoming is not None:
+            upcoming.cancel()
+
+
+class _PoolWorker(QObject, QRunnable):
+    """Base for workers that run directly on a QThreadPool.
+
+    The worker is its own runnable: run() executes on a pool thread and emits
+    the worker's signals straight to the GUI thread, with no moveToThread or
+    per-job QThread. Auto-delete is off because Python owns the object.
+    """
+
+    def __init__(self, parent=None):
+        QObject.__init__(self, parent)
+        QRunnable.__init__(self)
+        self.setAutoDelete(False)
+        self._cancelled = False
+        self._ffmpeg_lock = threading.Lock()
+        self._ffmpeg_procs = set()  # live audio decodes, killed on cancel / job end
+        self._ffmpeg_closed = False
+
+    def cancel(self):
+        self._cancelled = True
+        self._kill_ffmpeg()
+
+    def _should_stop(self) -> bool:
+        """Polled by the long core loops (transcription, frame scan)."""
+        return self._cancelled
 
+    def _run_ffmpeg(self, cmd: list[str]) -> bytes:
+        """Run an ffmpeg decode the worker can kill; returns its stdout."""
+        import subprocess
 
-class PipelineWorker(QObject):
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+        with self._ffmpeg_lock:
+            if self._ffmpeg_closed:
+                proc.kill()
+            self._ffmpeg_procs.add(proc)
+        try:
+            stdout, stderr = proc.communicate()
+        finally:
+            with self._ffmpeg_lock:
+                self._ffmpeg_procs.discard(proc)
+        if self._ffmpeg_closed:
+            raise RuntimeError("Audio decode cancelled")
+        if proc.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed: {stderr.decode(errors='replace')[:500]}")
+        return stdout
+
+    def _kill_ffmpeg(self):
+        """Kill running decodes; any started afterwards is killed at once."""
+        with self._ffmpeg_lock:
+            self._ffmpeg_closed = True
+            for proc in self._ffmpeg_procs:
+                proc.kill()
+
+
+class PipelineWorker(_PoolWorker):
     """Runs the full processing pipeline in a background thread."""
 
     progress = Signal(str, int)  # (message, percentage)
@@ -23,13 +107,12 @@ class PipelineWorker(QObject):
         super().__init__(parent)
         self.video_paths = video_paths
         self.settings = settings
-        self._cancelled = False
-
-    def cancel(self):
-        self._cancelled = True
+        self._model = None  # WhisperModel, loaded on first use and reused across files
 
     def run(self):
-        for i, video_path in enumerate(self.video_paths):
+        audio_pool = ThreadPoolExecutor(max_workers=1)
+        prefetch = _prefetch_audio(audio_pool, self.video_paths, self._extract_audio)
+        for i, video_path, audio_future in prefetch:
             if self._cancelled:
                 break
 
@@ -37,14 +120,21 @@ class PipelineWorker(QObject):
             self.file_started.emit(filename)
 
             try:
-                pairs = self._process_single(video_path, i, len(self.video_paths))
+                pairs = self._process_single(video_path, i, len(self.video_paths), audio_future)
                 self.file_finished.emit(filename, pairs)
             except Exception as e:
+                if self._cancelled:  # e.g. the decode killed by cancel()
+                    break
                 self.file_error.emit(filename, str(e))
 
+        # Drop the prefetched audio and kill a decode still in flight
+        prefetch.close()
+        audio_pool.shutdown(wait=False, cancel_futures=True)
+        self._kill_ffmpeg()
         self.all_finished.emit()
 
-    def _process_single(self, video_path: str, file_idx: int, total_files: int) -> list[CardPair]:
+    def _process_single(self, video_path: str, file_idx: int, total_files: int,
+                        audio_future: Future) -> list[CardPair]:
         base_pct = int(file_idx / total_files * 100)
         file_weight = 100 / total_files
 
@@ -55,12 +145,10 @@ class PipelineWorker(QObject):
         # Create temp working directory for this video
         work_dir = tempfile.mkdtemp(prefix="framedx_")
 
-        # Step 1: Extract audio via ffmpeg
+        # Step 1: Decode audio via ffmpeg straight into memory
         emit("[1/4] Extracting audio with ffmpeg...", 0)
-        audio_path = os.path.join(work_dir, "audio.wav")
-        self._extract_audio(video_path, audio_path)
-        audio_size_mb = os.path.getsize(audio_path) / (1024 * 1024)
-        emit(f"[1/4] Audio extracted ({audio_size_mb:.1f} MB)", 5)
+        audio = audio_future.result()
+        emit(f"[1/4] Audio extracted ({len(audio) / _SAMPLE_RATE / 60:.1f} min)", 5)
 
         if self._cancelled:
             return []
@@ -68,15 +156,17 @@ class PipelineWorker(QObject):
         # Step 2: Transcribe
         model_name = self.settings.get("whisper_model", "large-v3")
         compute = self.settings.get("compute_type", "int8")
-        emit(f"[2/4] Loading Whisper model ({model_name}, {compute})... this may take a minute", 8)
+        if self._model is None:
+            emit(f"[2/4] Loading Whisper model ({model_name}, {compute})... this may take a minute", 8)
+            self._model = load_model(model_name, compute)
         segments = transcribe(
-            audio_path,
-            model_size=model_name,
-            compute_type=compute,
+            audio,
             language=self.settings.get("language", "auto") or None,
             progress_callback=lambda msg: emit(f"[2/4] {msg}", 30),
+            model=self._model,
+            should_stop=self._should_stop,
         )
-        total_words = sum(len(s.words) for s in segments)
+        total_words = sum(s.word_starts.size for s in segments)
         emit(f"[2/4] Transcription complete — {len(segments)} segments, {total_words} words", 50)
 
         if self._cancelled:
@@ -89,7 +179,9 @@ class PipelineWorker(QObject):
             work_dir,
             ssim_threshold=self.settings.get("ssim_threshold", 0.85),
             frame_interval=self.settings.get("frame_interval", 2.0),
+            use_cuda=self.settings.get("use_cuda", False),
             progress_callback=lambda msg: emit(f"[3/4] {msg}", 70),
+            should_stop=self._should_stop,
         )
         emit(f"[3/4] Slide detection complete — {len(slides)} slides found", 80)
 
@@ -114,37 +206,33 @@ class PipelineWorker(QObject):
                 texts,
                 self.settings["anthropic_api_key"],
                 progress_callback=lambda msg: emit(msg, 95),
+                should_stop=self._should_stop,
             )
+            if self._cancelled:
+                return []
             for pair, text in zip(pairs, corrected):
                 pair.transcript_text = text
 
         emit(f"Done — {len(pairs)} cards ready for review", 100)
         return pairs
 
-    def _extract_audio(self, video_path: str, audio_path: str):
-        """Extract audio from video using ffmpeg subprocess."""
-        import subprocess
-
+    def _extract_audio(self, video_path: str) -> np.ndarray:
+        """Decode audio from video as 16 kHz mono float32 via an ffmpeg pipe."""
         cmd = [
-            "ffmpeg", "-y",
+            "ffmpeg",
             "-i", video_path,
             "-vn",
+            "-f", "s16le",
             "-acodec", "pcm_s16le",
-            "-ar", "16000",
+            "-ar", str(_SAMPLE_RATE),
             "-ac", "1",
-            audio_path,
+            "-",
         ]
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-        )
-        if result.returncode != 0:
-            raise RuntimeError(f"ffmpeg failed: {result.stderr[:500]}")
+        stdout = self._run_ffmpeg(cmd)
+        return np.frombuffer(stdout, dtype=np.int16).astype(np.float32) / 32768.0
 
 
-class TranscriptWorker(QObject):
+class TranscriptWorker(_PoolWorker):
     """Transcription-only worker: outputs .txt and/or .srt files."""
 
     progress = Signal(str, int)
@@ -161,13 +249,12 @@ class TranscriptWorker(QObject):
         self.output_dir = output_dir
         self.export_txt = export_txt
         self.export_srt = export_srt
-        self._cancelled = False
-
-    def cancel(self):
-        self._cancelled = True
+        self._model = None  # WhisperModel, loaded on first use and reused across files
 
     def run(self):
-        for i, video_path in enumerate(self.video_paths):
+        audio_pool = ThreadPoolExecutor(max_workers=1)
+        prefetch = _prefetch_audio(audio_pool, self.video_paths, self._extract_audio)
+        for i, video_path, audio_future in prefetch:
             if self._cancelled:
                 break
 
@@ -185,10 +272,7 @@ class TranscriptWorker(QObject):
 
                 # Extract audio
                 emit(f"[1/2] Extracting audio...", 0)
-                import tempfile
-                work_dir = tempfile.mkdtemp(prefix="framedx_transcript_")
-                audio_path = os.path.join(work_dir, "audio.wav")
-                self._extract_audio(video_path, audio_path)
+                audio = audio_future.result()
                 emit(f"[1/2] Audio extracted", 10)
 
                 if self._cancelled:
@@ -197,14 +281,19 @@ class TranscriptWorker(QObject):
                 # Transcribe
                 model_name = self.settings.get("whisper_model", "large-v3")
                 compute = self.settings.get("compute_type", "int8")
+                if self._model is None:
+                    emit(f"[2/2] Loading Whisper model ({model_name}, {compute})...", 12)
+                    self._model = load_model(model_name, compute)
                 emit(f"[2/2] Transcribing ({model_name}, {compute})...", 15)
                 segments = transcribe(
-                    audio_path,
-                    model_size=model_name,
-                    compute_type=compute,
+                    audio,
                     language=self.settings.get("language", "auto") or None,
                     progress_callback=lambda msg: emit(f"[2/2] {msg}", 50),
+                    model=self._model,
+                    should_stop=self._should_stop,
                 )
+                if self._cancelled:
+                    break
 
                 # Write output files
                 os.makedirs(self.output_dir, exist_ok=True)
@@ -221,31 +310,32 @@ class TranscriptWorker(QObject):
                         f.write(segments_to_srt(segments))
                     saved.append(srt_path)
 
-                total_words = sum(len(s.words) for s in segments)
+                total_words = sum(s.word_starts.size for s in segments)
                 emit(f"Done — {len(segments)} segments, {total_words} words → {', '.join(Path(p).name for p in saved)}", 100)
                 self.file_finished.emit(filename, [])
 
             except Exception as e:
+                if self._cancelled:  # e.g. the decode killed by cancel()
+                    break
                 self.file_error.emit(filename, str(e))
 
+        # Drop the prefetched audio and kill a decode still in flight
+        prefetch.close()
+        audio_pool.shutdown(wait=False, cancel_futures=True)
+        self._kill_ffmpeg()
         self.all_finished.emit()
 
-    def _extract_audio(self, video_path: str, audio_path: str):
-        import subprocess
+    def _extract_audio(self, video_path: str) -> np.ndarray:
         cmd = [
-            "ffmpeg", "-y", "-i", video_path,
-            "-vn", "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1",
-            audio_path,
+            "ffmpeg", "-i", video_path,
+            "-vn", "-f", "s16le", "-acodec", "pcm_s16le", "-ar", str(_SAMPLE_RATE), "-ac", "1",
+            "-",
         ]
-        result = subprocess.run(
-            cmd, capture_output=True, text=True,
-            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-        )
-        if result.returncode != 0:
-            raise RuntimeError(f"ffmpeg failed: {result.stderr[:500]}")
+        stdout = self._run_ffmpeg(cmd)
+        return np.frombuffer(stdout, dtype=np.int16).astype(np.float32) / 32768.0
 
 
-class SlidesWorker(QObject):
+class SlidesWorker(_PoolWorker):
     """Slides-only worker: extracts slide images to a named folder."""
 
     progress = Signal(str, int)
@@ -259,10 +349,6 @@ class SlidesWorker(QObject):
         self.video_paths = video_paths
         self.settings = settings
         self.output_dir = output_dir
-        self._cancelled = False
-
-    def cancel(self):
-        self._cancelled = True
 
     def run(self):
         import shutil
@@ -292,8 +378,12 @@ class SlidesWorker(QObject):
                     work_dir,
                     ssim_threshold=self.settings.get("ssim_threshold", 0.85),
                     frame_interval=self.settings.get("frame_interval", 2.0),
+                    use_cuda=self.settings.get("use_cuda", False),
                     progress_callback=lambda msg: emit(msg, 50),
+                    should_stop=self._should_stop,
                 )
+                if self._cancelled:
+                    break
 
                 # Copy slides to output folder named after the video
                 dest_dir = os.path.join(self.output_dir, stem)
@@ -313,34 +403,68 @@ class SlidesWorker(QObject):
         self.all_finished.emit()
 
 
-def create_pipeline_thread(video_paths: list[str], settings: dict) -> tuple[QThread, PipelineWorker]:
-    """Create and wire up a pipeline worker in a QThread. Caller must call thread.start()."""
-    thread = QThread()
-    worker = PipelineWorker(video_paths, settings)
-    worker.moveToThread(thread)
-    thread.started.connect(worker.run)
-    worker.all_finished.connect(thread.quit)
-    return thread, worker
+class ProgressCoalescer(QObject):
+    """Collapses bursts of worker progress signals into one GUI-thread call.
+
+    Connect a worker's progress signal to post() with Qt.DirectConnection so
+    it runs on the worker thread. The first post of a batch queues a single
+    wake-up; everything posted into the batch before the GUI thread gets to
+    it is delivered together as coalesced(messages, latest_pct).
 
+    Connect the worker's other signals to barrier() with Qt.DirectConnection,
+    ahead of their GUI slots: it closes the open batch, so progress posted
+    after e.g. file_finished is delivered after that signal, not before.
+    """
 
-def create_transcript_thread(
+    coalesced = Signal(list, int)  # (messages in order, latest percentage)
+    _wake = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._batches = deque()  # [messages, pct], one queued wake-up each
+        self._open = False  # whether the last batch still takes posts
+        self._wake.connect(self._deliver, Qt.QueuedConnection)
+
+    def post(self, message: str, pct: int):
+        with self._lock:
+            wake = not self._open
+            if wake:
+                self._batches.append([[], pct])
+                self._open = True
+            batch = self._batches[-1]
+            batch[0].append(message)
+            batch[1] = pct
+        if wake:
+            self._wake.emit()
+
+    def barrier(self, *_):
+        with self._lock:
+            self._open = False
+
+    def _deliver(self):
+        with self._lock:
+            if not self._batches:
+                return
+            messages, pct = self._batches.popleft()
+            if not self._batches:
+                self._open = False
+        self.coalesced.emit(messages, pct)
+
+
+def create_pipeline_job(video_paths: list[str], settings: dict) -> PipelineWorker:
+    """Create a pipeline worker. Caller submits it to a QThreadPool."""
+    return PipelineWorker(video_paths, settings)
+
+
+def create_transcript_job(
     video_paths: list[str], settings: dict, output_dir: str,
     export_txt: bool = True, export_srt: bool = True,
-) -> tuple[QThread, TranscriptWorker]:
-    thread = QThread()
-    worker = TranscriptWorker(video_paths, settings, output_dir, export_txt, export_srt)
-    worker.moveToThread(thread)
-    thread.started.connect(worker.run)
-    worker.all_finished.connect(thread.quit)
-    return thread, worker
+) -> TranscriptWorker:
+    return TranscriptWorker(video_paths, settings, output_dir, export_txt, export_srt)
 
 
-def create_slides_thread(
+def create_slides_job(
     video_paths: list[str], settings: dict, output_dir: str,
-) -> tuple[QThread, SlidesWorker]:
-    thread = QThread()
-    worker = SlidesWorker(video_paths, settings, output_dir)
-    worker.moveToThread(thread)
-    thread.started.connect(worker.run)
-    worker.all_finished.connect(thread.quit)
-    return thread, worker
+) -> SlidesWorker:
+    return SlidesWorker(video_paths, settings, output_dir)
@@ -1,12 +1,10 @@
 from dataclasses import dataclass
-from faster_whisper import WhisperModel
+from typing import TYPE_CHECKING
 
+import numpy as np
 
-@dataclass
-class WordTimestamp:
-    word: str
-    start: float
-    end: float
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
 
 
 @dataclass
@@ -14,21 +12,46 @@ class TranscriptSegment:
     text: str
     start: float
     end: float
-    words: list[WordTimestamp]
+    # Word-level timestamps as parallel arrays (structure of arrays)
+    words: list[str]
+    word_starts: np.ndarray  # float32, seconds
+    word_ends: np.ndarray  # float32, seconds
+
+
+def load_model(model_size: str = "large-v3", compute_type: str = "int8") -> "WhisperModel":
+    """Load a CPU WhisperModel, skipping the Hub check when it is already cached."""
+    # Imported here so the GUI starts without pulling in CTranslate2
+    from faster_whisper import WhisperModel
+
+    try:
+        return WhisperModel(model_size, device="cpu", compute_type=compute_type, local_files_only=True)
+    except Exception:
+        # Not in the local cache yet — allow downloading it
+        return WhisperModel(model_size, device="cpu", compute_type=compute_type)
 
 
 def transcribe(
-    audio_path: str,
+    audio: str | np.ndarray,
     model_size: str = "large-v3",
     compute_type: str = "int8",
     language: str | None = None,
     progress_callback=None,
+    model: "WhisperModel | None" = None,
+    should_stop=None,
 ) -> list[TranscriptSegment]:
-    """Transcribe audio file and return segments with word-level timestamps."""
-    if progress_callback:
-        progress_callback("Loading Whisper model...")
+    """Transcribe audio and return segments with word-level timestamps.
+
+    audio is a file path or a 16 kHz mono float32 array.
 
-    model = WhisperModel(model_size, device="cpu", compute_type=compute_type)
+    Pass a preloaded model (see load_model) to reuse it across files;
+    otherwise one is loaded from model_size/compute_type. should_stop is
+    polled between segments; once it returns True the segments decoded so
+    far are returned.
+    """
+    if model is None:
+        if progress_callback:
+            progress_callback("Loading Whisper model...")
+        model = load_model(model_size, compute_type)
 
     lang = None if language == "auto" else language
 
@@ -36,7 +59,7 @@ def transcribe(
         progress_callback("Transcribing audio...")
 
     segments_iter, info = model.transcribe(
-        audio_path,
+        audio,
         language=lang,
         word_timestamps=True,
         vad_filter=True,
@@ -47,16 +70,21 @@ def transcribe(
 
     results = []
     for segment in segments_iter:
-        words = []
-        if segment.words:
-            for w in segment.words:
-                words.append(WordTimestamp(word=w.word.strip(), start=w.start, end=w.end))
+        if should_stop is not None and should_stop():
+            break
+        words, starts, ends = [], [], []
+        for w in segment.words or ():
+            words.append(w.word.strip())
+            starts.append(w.start)
+            ends.append(w.end)
 
         results.append(TranscriptSegment(
             text=segment.text.strip(),
             start=segment.start,
             end=segment.end,
             words=words,
+            word_starts=np.asarray(starts, dtype=np.float32),
+            word_ends=np.asarray(ends, dtype=np.float32),
         ))
 
     return results
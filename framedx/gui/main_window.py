@@ -1,9 +1,11 @@
 import os
+import time
 from pathlib import Path
 
 from datetime import datetime
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QThread, QThreadPool, QTimer
+from PySide6.QtGui import QPainter
 from PySide6.QtWidgets import (
     QApplication,
     QFileDialog,
@@ -22,28 +24,84 @@ from PySide6.QtWidgets import (
 )
 
 from framedx.config.settings import load_settings, save_settings
-from framedx.core.anki_exporter import export_deck
-from framedx.core.pipeline import create_pipeline_thread, create_transcript_thread, create_slides_thread
+from framedx.core.pipeline import (
+    ProgressCoalescer,
+    create_pipeline_job,
+    create_slides_job,
+    create_transcript_job,
+)
 from framedx.gui.queue_panel import QueuePanel
 from framedx.gui.review_panel import ReviewPanel
 from framedx.gui.settings_panel import SettingsPanel
-from framedx.gui.styles import get_style
+from framedx.gui.styles import apply_style
+
+# Longest closeEvent waits for a cancelled job to wind down
+_CLOSE_WAIT_MS = 10000
+
+
+class _BatchedLabel(QLabel):
+    """Status label whose text changes only schedule a repaint.
+
+    QLabel.setText also recomputes the size hint and relayouts the status
+    bar; this label draws its pending text itself, elided to the current
+    width, so frequent progress messages cost one coalesced paint.
+    """
+
+    def __init__(self, text: str = "", parent=None):
+        super().__init__(parent)
+        self._pending_text = text
+
+    def set_pending(self, text: str):
+        if text != self._pending_text:
+            self._pending_text = text
+            self.update()
+
+    def pending_text(self) -> str:
+        return self._pending_text
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        rect = self.contentsRect()
+        text = self.fontMetrics().elidedText(self._pending_text, Qt.ElideRight, rect.width())
+        self.style().drawItemText(
+            painter, rect, Qt.AlignLeft | Qt.AlignVCenter, self.palette(), self.isEnabled(), text,
+            self.foregroundRole(),
+        )
 
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, settings: dict | None = None):
         super().__init__()
         self.setWindowTitle("FrameDX — Medical Lecture Video to Anki Flashcard Extractor")
         self.setMinimumSize(1000, 700)
         self.resize(1200, 800)
 
-        self._settings = load_settings()
-        self._thread = None
+        self._settings = settings if settings is not None else load_settings()
+        self._last_saved = dict(self._settings)  # what settings.json holds now
+        # Coalesce settings writes from edits and Start clicks into one disk write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_settings)
+        # Jobs run on a window-owned pool; one thread is left for the GUI
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, QThread.idealThreadCount() - 1))
         self._worker = None
-        self._elapsed_seconds = 0
-        self._timer = QTimer(self)
-        self._timer.setInterval(1000)
-        self._timer.timeout.connect(self._tick_elapsed)
+        self._start_time = None  # time.monotonic() when the running job started
+        self._shown_elapsed = -1
+
+        # Log lines and progress from workers are buffered and applied at most
+        # every 100 ms, so bursts of signals don't reflow the log per line.
+        # While a job runs the same timer also refreshes the elapsed clock.
+        self._log_buffer = []
+        self._pending_pct = None  # latest progress not yet shown
+        self._pending_status = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(100)
+        self._flush_timer.timeout.connect(self._flush_log)
+        self._progress = ProgressCoalescer(self)
+        self._progress.coalesced.connect(self._on_progress)
 
         self._setup_ui()
         self._apply_theme()
@@ -66,6 +124,7 @@ class MainWindow(QMainWindow):
 
         self.settings_panel = SettingsPanel(self._settings)
         self.settings_panel.dark_mode_check.stateChanged.connect(self._on_theme_toggle)
+        self.settings_panel.settings_changed.connect(self._save_and_get_settings)
         left_layout.addWidget(self.settings_panel)
 
         # Process button
@@ -110,8 +169,12 @@ class MainWindow(QMainWindow):
         log_layout = QVBoxLayout(log_group)
         self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setMaximumBlockCount(1000)
-        self.log_text.setStyleSheet("font-family: 'Consolas', 'Courier New', monospace; font-size: 11px;")
+        # Keep the log cheap to append to: short scrollback, no wrapping, no undo
+        self.log_text.setMaximumBlockCount(200)
+        self.log_text.setCenterOnScroll(False)
+        self.log_text.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.log_text.setUndoRedoEnabled(False)
+        self.log_text.setObjectName("log")  # monospace font comes from the app stylesheet
         log_layout.addWidget(self.log_text)
         left_layout.addWidget(log_group, stretch=1)
 
@@ -128,14 +191,13 @@ class MainWindow(QMainWindow):
         # Status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
-        self.status_label = QLabel("Ready")
+        self.status_label = _BatchedLabel("Ready")
         self.elapsed_label = QLabel("")
         self.status_bar.addWidget(self.status_label, stretch=1)
         self.status_bar.addPermanentWidget(self.elapsed_label)
 
     def _apply_theme(self):
-        dark = self.settings_panel.dark_mode_check.isChecked()
-        QApplication.instance().setStyleSheet(get_style(dark))
+        apply_style(QApplication.instance(), self.settings_panel.dark_mode_check.isChecked())
 
     def _on_theme_toggle(self):
         self._apply_theme()
@@ -151,8 +213,8 @@ class MainWindow(QMainWindow):
         self._log(f"Model: {settings.get('whisper_model')} | Compute: {settings.get('compute_type')} | "
                   f"Language: {settings.get('language')}")
 
-        thread, worker = create_pipeline_thread(paths, settings)
-        self._start_worker(thread, worker, "Anki Pipeline")
+        worker = create_pipeline_job(paths, settings)
+        self._start_worker(worker, "Anki Pipeline")
 
     def _get_output_dir(self) -> str:
         """Get output directory from settings or ask user."""
@@ -161,36 +223,57 @@ class MainWindow(QMainWindow):
             output_dir = QFileDialog.getExistingDirectory(self, "Select Output Directory")
         return output_dir
 
-    def _save_and_get_settings(self) -> dict:
+    def _collect_settings(self):
+        """Merge the current panel values into the cached settings."""
         s = self.settings_panel.get_settings()
         s["last_directory"] = self.queue_panel.get_last_directory()
         self._settings.update(s)
+
+    def _save_and_get_settings(self) -> dict:
+        self._collect_settings()
+        if self._settings != self._last_saved:
+            self._save_timer.start()
+        # A snapshot: panel edits during a job must not reach its worker
+        return dict(self._settings)
+
+    def _flush_settings(self):
+        """Write settings to disk if they changed since the last save."""
+        self._save_timer.stop()
+        if self._settings == self._last_saved:
+            return
         save_settings(self._settings)
-        return self._settings
+        self._last_saved = dict(self._settings)
 
-    def _start_worker(self, thread, worker, mode_label: str):
-        """Shared logic for starting any worker thread."""
+    def _start_worker(self, worker, mode_label: str):
+        """Shared logic for starting any worker on the thread pool."""
         self.btn_process.setEnabled(False)
         self.btn_transcript.setEnabled(False)
         self.btn_slides.setEnabled(False)
         self.btn_cancel.setVisible(True)
         self.queue_panel.set_enabled_all(False)
         self.progress_bar.setValue(0)
-        self._elapsed_seconds = 0
-        self._timer.start()
+        self._start_time = time.monotonic()
+        self._shown_elapsed = -1
+        self._update_elapsed()
 
         self.log_text.clear()
+        self._log_buffer.clear()
         self._log(f"Mode: {mode_label}")
 
-        self._thread = thread
         self._worker = worker
-        self._worker.progress.connect(self._on_progress)
+        # Progress goes through the coalescer on the worker thread, so a burst
+        # of updates reaches the GUI thread as one queued call
+        self._worker.progress.connect(self._progress.post, Qt.DirectConnection)
+        # Cut the progress batch at each file event, ahead of the GUI slots,
+        # so the log keeps the order the worker emitted in
+        for sig in (worker.file_started, worker.file_finished, worker.file_error, worker.all_finished):
+            sig.connect(self._progress.barrier, Qt.DirectConnection)
         self._worker.file_started.connect(self._on_file_started)
         self._worker.file_finished.connect(self._on_file_finished_simple
                                            if mode_label != "Anki Pipeline" else self._on_file_finished)
         self._worker.file_error.connect(self._on_file_error)
         self._worker.all_finished.connect(self._on_all_finished)
-        self._thread.start()
+        self._pool.start(worker)
 
     def _on_file_finished_simple(self, filename: str, _pairs: list):
         """For transcript/slides modes that produce no card pairs."""
@@ -212,10 +295,10 @@ class MainWindow(QMainWindow):
         self._log(f"Model: {settings.get('whisper_model')} | Compute: {settings.get('compute_type')} | "
                   f"Language: {settings.get('language')} | Output: {output_dir}")
 
-        thread, worker = create_transcript_thread(
+        worker = create_transcript_job(
             paths, settings, output_dir, export_txt=True, export_srt=True,
         )
-        self._start_worker(thread, worker, "Transcript Only")
+        self._start_worker(worker, "Transcript Only")
 
     def _start_slides_only(self):
         paths = self.queue_panel.get_file_paths()
@@ -232,26 +315,60 @@ class MainWindow(QMainWindow):
         self._log(f"SSIM: {settings.get('ssim_threshold')} | Interval: {settings.get('frame_interval')}s | "
                   f"Output: {output_dir}")
 
-        thread, worker = create_slides_thread(paths, settings, output_dir)
-        self._start_worker(thread, worker, "Slides Only")
+        worker = create_slides_job(paths, settings, output_dir)
+        self._start_worker(worker, "Slides Only")
 
     def _cancel_processing(self):
         if self._worker:
             self._worker.cancel()
-        self.status_label.setText("Cancelling...")
+        self._flush_log()
+        self.status_label.set_pending("Cancelling...")
 
     def _log(self, message: str):
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.appendPlainText(f"[{timestamp}] {message}")
-
-    def _on_progress(self, message: str, pct: int):
-        self.progress_bar.setValue(pct)
-        self.status_label.setText(message)
-        self._log(message)
+        self._log_buffer.append(f"[{timestamp}] {message}")
+        # Pull an idle one-second clock tick forward to the short flush delay
+        if not self._flush_timer.isActive() or self._flush_timer.interval() > 100:
+            self._flush_timer.start(100)
+
+    def _flush_log(self):
+        """Apply buffered log lines and the latest progress in one update."""
+        self._flush_timer.stop()
+        if self._log_buffer:
+            self.log_text.appendPlainText("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+        if self._pending_pct is not None:
+            self.progress_bar.setValue(self._pending_pct)
+            self._pending_pct = None
+        if self._pending_status is not None:
+            self.status_label.set_pending(self._pending_status)
+            self._pending_status = None
+        if self._start_time is not None:
+            self._update_elapsed()
+            # Keep the clock moving when the worker is quiet, waking up just
+            # after the next whole second
+            frac = (time.monotonic() - self._start_time) % 1.0
+            self._flush_timer.start(int((1.0 - frac) * 1000) + 5)
+
+    def _elapsed(self) -> int:
+        return int(time.monotonic() - self._start_time)
+
+    def _update_elapsed(self):
+        elapsed = self._elapsed()
+        if elapsed != self._shown_elapsed:
+            self._shown_elapsed = elapsed
+            m, s = divmod(elapsed, 60)
+            self.elapsed_label.setText(f"Elapsed: {m:02d}:{s:02d}")
+
+    def _on_progress(self, messages: list, pct: int):
+        self._pending_pct = pct
+        self._pending_status = messages[-1]
+        for message in messages:
+            self._log(message)
 
     def _on_file_started(self, filename: str):
         self.queue_panel.set_file_status(filename, "Processing...")
-        self.status_label.setText(f"Processing: {filename}")
+        self._pending_status = f"Processing: {filename}"
         self._log(f"--- Started: {filename} ---")
 
     def _on_file_finished(self, filename: str, pairs: list):
@@ -265,28 +382,22 @@ class MainWindow(QMainWindow):
         QMessageBox.warning(self, f"Error: {filename}", error[:500])
 
     def _on_all_finished(self):
-        self._timer.stop()
+        self._flush_log()
+        elapsed = self._elapsed()
+        self._start_time = None
+        self._flush_timer.stop()
         self.btn_process.setEnabled(True)
         self.btn_transcript.setEnabled(True)
         self.btn_slides.setEnabled(True)
         self.btn_cancel.setVisible(False)
         self.queue_panel.set_enabled_all(True)
         self.progress_bar.setValue(100)
-        self.status_label.setText("Processing complete")
-        m, s = divmod(self._elapsed_seconds, 60)
+        self.status_label.set_pending("Processing complete")
+        m, s = divmod(elapsed, 60)
         self._log(f"=== All processing complete — Total time: {m:02d}:{s:02d} ===")
 
-        # Cleanup thread
-        if self._thread:
-            self._thread.quit()
-            self._thread.wait()
-            self._thread = None
-            self._worker = None
-
-    def _tick_elapsed(self):
-        self._elapsed_seconds += 1
-        m, s = divmod(self._elapsed_seconds, 60)
-        self.elapsed_label.setText(f"Elapsed: {m:02d}:{s:02d}")
+        # run() returns right after all_finished; the pool reuses its thread
+        self._worker = None
 
     def _export_deck(self):
         pairs = self.review_panel.get_included_pairs()
@@ -300,6 +411,8 @@ class MainWindow(QMainWindow):
             if not output_dir:
                 return
 
+        from framedx.core.anki_exporter import export_deck
+
         deck_name = "FrameDX Deck"
         output_path = os.path.join(output_dir, "framedx_deck.apkg")
 
@@ -320,17 +433,17 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Export Error", str(e)[:500])
 
     def closeEvent(self, event):
-        # Save settings on close
-        s = self.settings_panel.get_settings()
-        s["last_directory"] = self.queue_panel.get_last_directory()
-        self._settings.update(s)
-        save_settings(self._settings)
-
-        # Cancel any running pipeline
+        # Save settings on close; _flush_settings skips the write if the
+        # settings match what was last saved
+        self._collect_settings()
+        self._flush_settings()
+
+        # Cancel any running job; the workers check the flag between
+        # segments, scanned frames, LLM batches and files. The wait is still
+        # bounded, since a Whisper model load can't be interrupted.
         if self._worker:
             self._worker.cancel()
-        if self._thread and self._thread.isRunning():
-            self._thread.quit()
-            self._thread.wait(3000)
+            self.hide()
+            self._pool.waitForDone(_CLOSE_WAIT_MS)
 
         event.accept()
@@ -1,6 +1,7 @@
+import os
 from pathlib import Path
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, Signal
 from PySide6.QtWidgets import (
     QFileDialog,
     QGroupBox,
@@ -15,6 +16,65 @@ from PySide6.QtWidgets import (
 
 VIDEO_EXTENSIONS = {".mp4", ".mkv", ".avi", ".webm", ".mov", ".wmv"}
 
+# Extensions without the dot, matched against the tail of a file name
+_VIDEO_EXTS_NODOT = {e[1:] for e in VIDEO_EXTENSIONS}
+
+# Paths sent back to the GUI per signal while scanning a folder
+_SCAN_BATCH = 64
+
+
+def _iter_videos(root: str):
+    """Yield video file paths under root, walking subfolders in name order.
+
+    Uses os.scandir directly: the extension test is done on the entry name
+    and directory checks use the type info scandir already returned.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    continue
+            except OSError:
+                continue
+            name = entry.name
+            if "." in name and name.rpartition(".")[2].lower() in _VIDEO_EXTS_NODOT:
+                yield entry.path
+        # Reversed so subfolders are popped in name order
+        stack.extend(reversed(subdirs))
+
+
+class _ScanSignals(QObject):
+    batch = Signal(list)
+    finished = Signal()
+
+
+class _ScanRunnable(QRunnable):
+    """Walks a folder tree on the thread pool, emitting video paths in batches."""
+
+    def __init__(self, folder: str):
+        super().__init__()
+        self.folder = folder
+        self.signals = _ScanSignals()
+
+    def run(self):
+        batch = []
+        for path in _iter_videos(self.folder):
+            batch.append(path)
+            if len(batch) >= _SCAN_BATCH:
+                self.signals.batch.emit(batch)
+                batch = []
+        if batch:
+            self.signals.batch.emit(batch)
+        self.signals.finished.emit()
+
 
 class QueuePanel(QWidget):
     files_changed = Signal()  # emitted when the file list changes
@@ -22,6 +82,11 @@ class QueuePanel(QWidget):
     def __init__(self, last_directory: str = "", parent=None):
         super().__init__(parent)
         self._last_dir = last_directory
+        # Lookup indexes kept in sync with the table, in row order
+        self._paths: dict[str, QTableWidgetItem] = {}  # full path -> status item
+        self._status_by_name: dict[str, QTableWidgetItem] = {}
+        self._scan = None  # running _ScanRunnable, if any
+        self._scan_added = False
         self._setup_ui()
 
     def _setup_ui(self):
@@ -76,70 +141,98 @@ class QueuePanel(QWidget):
         )
         if files:
             self._last_dir = str(Path(files[0]).parent)
-            for f in files:
-                self._add_file_row(f)
+            self._add_file_rows(files)
             self.files_changed.emit()
 
     def _add_folder(self):
         folder = QFileDialog.getExistingDirectory(self, "Select Folder", self._last_dir)
         if folder:
             self._last_dir = folder
-            count = 0
-            for path in Path(folder).rglob("*"):
-                if path.suffix.lower() in VIDEO_EXTENSIONS:
-                    self._add_file_row(str(path))
-                    count += 1
-            if count:
-                self.files_changed.emit()
-
-    def _add_file_row(self, file_path: str):
-        # Skip duplicates
+            # Walk the tree off the GUI thread; results arrive as queued signals
+            self.btn_add_folder.setEnabled(False)
+            self._scan_added = False
+            self._scan = _ScanRunnable(folder)
+            self._scan.signals.batch.connect(self._on_scan_batch)
+            self._scan.signals.finished.connect(self._on_scan_finished)
+            QThreadPool.globalInstance().start(self._scan)
+
+    def _on_scan_batch(self, paths: list):
+        self._add_file_rows(paths)
+        self._scan_added = True
+
+    def _on_scan_finished(self):
+        self._scan = None
+        self.btn_add_folder.setEnabled(self.btn_add_files.isEnabled())
+        if self._scan_added:
+            self.files_changed.emit()
+
+    def _add_file_rows(self, file_paths: list[str]):
+        # Skip duplicates, including repeats within this batch
+        new_paths = list(dict.fromkeys(p for p in file_paths if p not in self._paths))
+        if not new_paths:
+            return
+
+        # Grow the table once and fill it with repaints suspended, instead of
+        # a relayout per insertRow
+        start = self.table.rowCount()
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table.setRowCount(start + len(new_paths))
+            for row, file_path in enumerate(new_paths, start):
+                name_item = QTableWidgetItem(Path(file_path).name)
+                name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
+                status_item = QTableWidgetItem("Pending")
+                status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
+                # Read-only too: _paths is keyed by the path as added, and the
+                # name column would not follow an edit anyway
+                path_item = QTableWidgetItem(file_path)
+                path_item.setFlags(path_item.flags() & ~Qt.ItemIsEditable)
+                self.table.setItem(row, 0, name_item)
+                self.table.setItem(row, 1, status_item)
+                self.table.setItem(row, 2, path_item)
+                self._paths[file_path] = status_item
+                self._status_by_name.setdefault(name_item.text(), status_item)
+        finally:
+            self.table.setUpdatesEnabled(True)
+        self.table.viewport().update()
+
+    def _reindex(self):
+        """Rebuild the lookup indexes from the table after rows are removed."""
+        self._paths.clear()
+        self._status_by_name.clear()
         for row in range(self.table.rowCount()):
-            if self.table.item(row, 2) and self.table.item(row, 2).text() == file_path:
-                return
-
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        name_item = QTableWidgetItem(Path(file_path).name)
-        name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-        status_item = QTableWidgetItem("Pending")
-        status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-        path_item = QTableWidgetItem(file_path)
-        self.table.setItem(row, 0, name_item)
-        self.table.setItem(row, 1, status_item)
-        self.table.setItem(row, 2, path_item)
+            status_item = self.table.item(row, 1)
+            self._paths[self.table.item(row, 2).text()] = status_item
+            self._status_by_name.setdefault(self.table.item(row, 0).text(), status_item)
 
     def _remove_selected(self):
         rows = sorted(set(idx.row() for idx in self.table.selectedIndexes()), reverse=True)
         for row in rows:
             self.table.removeRow(row)
         if rows:
+            self._reindex()
             self.files_changed.emit()
 
     def _clear_all(self):
         if self.table.rowCount() > 0:
             self.table.setRowCount(0)
+            self._paths.clear()
+            self._status_by_name.clear()
             self.files_changed.emit()
 
     def get_file_paths(self) -> list[str]:
-        paths = []
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 2)
-            if item:
-                paths.append(item.text())
-        return paths
+        return list(self._paths)
 
     def set_file_status(self, filename: str, status: str):
-        for row in range(self.table.rowCount()):
-            if self.table.item(row, 0) and self.table.item(row, 0).text() == filename:
-                self.table.item(row, 1).setText(status)
-                break
+        item = self._status_by_name.get(filename)
+        if item is not None:
+            item.setText(status)
 
     def get_last_directory(self) -> str:
         return self._last_dir
 
     def set_enabled_all(self, enabled: bool):
         self.btn_add_files.setEnabled(enabled)
-        self.btn_add_folder.setEnabled(enabled)
+        self.btn_add_folder.setEnabled(enabled and self._scan is None)
         self.btn_remove.setEnabled(enabled)
         self.btn_clear.setEnabled(enabled)
@@ -1,21 +1,71 @@
+import os
+from collections import OrderedDict
 from pathlib import Path
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QEvent,
+    QModelIndex,
+    QObject,
+    QRect,
+    QRunnable,
+    QSize,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QAction, QImage, QKeySequence, QPixmap
 from PySide6.QtWidgets import (
-    QCheckBox,
+    QAbstractItemView,
     QDialog,
     QHBoxLayout,
     QLabel,
+    QListView,
     QPlainTextEdit,
     QPushButton,
     QScrollArea,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
     QVBoxLayout,
     QWidget,
 )
 
 from framedx.core.matcher import CardPair
 
+# Card row geometry
+_THUMB_W, _THUMB_H = 200, 150
+_MARGIN = 4
+_CHECK_W = 24
+_TEXT_MAX_H = 120
+
+# Decoded thumbnails kept per model
+_THUMB_CACHE_SIZE = 256
+
+
+class _ThumbSignals(QObject):
+    loaded = Signal(str, QImage)  # (image path, scaled image; null if unreadable)
+
+
+class ThumbLoader(QRunnable):
+    """Decodes and scales one slide thumbnail on a pool thread.
+
+    Works on QImage, which unlike QPixmap is safe off the GUI thread; the
+    model converts the result to a QPixmap when the queued signal arrives.
+    """
+
+    def __init__(self, path: str, signals: _ThumbSignals):
+        super().__init__()
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        image = QImage(self.path)
+        if not image.isNull():
+            image = image.scaled(_THUMB_W, _THUMB_H, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.signals.loaded.emit(self.path, image)
+
 
 class ImageDialog(QDialog):
     """Full-resolution image viewer."""
@@ -24,95 +74,287 @@ class ImageDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle(Path(image_path).name)
         self.setMinimumSize(800, 600)
+        # The dialog holds a full-size image; free it as soon as it closes
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self._image_path = image_path
+        self._pixmap = None  # full-size image, decoded on first show
+        self._loaded = False
 
         layout = QVBoxLayout(self)
-        label = QLabel()
-        pixmap = QPixmap(image_path)
-        label.setPixmap(pixmap.scaled(
-            self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
-        ))
-        label.setAlignment(Qt.AlignCenter)
+        self._label = QLabel()
+        self._label.setAlignment(Qt.AlignCenter)
 
         scroll = QScrollArea()
-        scroll.setWidget(label)
+        scroll.setWidget(self._label)
         scroll.setWidgetResizable(True)
         layout.addWidget(scroll)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._loaded:
+            self._loaded = True
+            # Quick nearest-neighbour scale for the first paint, then replace
+            # it with the smooth one once the dialog is on screen
+            self._pixmap = QPixmap(self._image_path)
+            self._label.setPixmap(self._pixmap.scaled(
+                self.size(), Qt.KeepAspectRatio, Qt.FastTransformation
+            ))
+            QTimer.singleShot(50, self, self._smooth_rescale)
+
+    def _smooth_rescale(self):
+        self._label.setPixmap(self._pixmap.scaled(
+            self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
+        ))
+        # Only the scaled copy is shown; drop the full-size one
+        self._pixmap = None
 
-class CardWidget(QWidget):
-    """Single card: thumbnail + editable text + controls."""
 
-    deleted = Signal(object)  # emits self
+def _row_runs(rows) -> list[list[int]]:
+    """Group sorted row numbers into [first, last] runs of consecutive rows."""
+    runs = []
+    for row in rows:
+        if runs and row == runs[-1][1] + 1:
+            runs[-1][1] = row
+        else:
+            runs.append([row, row])
+    return runs
 
-    def __init__(self, pair: CardPair, index: int, parent=None):
-        super().__init__(parent)
-        self.pair = pair
-        self._index = index
-        self._setup_ui()
 
-    def _setup_ui(self):
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(4, 4, 4, 4)
-
-        # Checkbox
-        self.checkbox = QCheckBox()
-        self.checkbox.setChecked(self.pair.included)
-        self.checkbox.stateChanged.connect(
-            lambda state: setattr(self.pair, "included", state == Qt.Checked)
-        )
-        layout.addWidget(self.checkbox)
-
-        # Thumbnail
-        self.thumb_label = QLabel()
-        self.thumb_label.setFixedSize(200, 150)
-        self.thumb_label.setCursor(Qt.PointingHandCursor)
-        self.thumb_label.setToolTip("Click to view full size")
-        pixmap = QPixmap(self.pair.image_path)
-        if not pixmap.isNull():
-            self.thumb_label.setPixmap(
-                pixmap.scaled(200, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            )
+class CardListModel(QAbstractListModel):
+    """List model over CardPairs: checkable, with an editable transcript."""
+
+    PairRole = Qt.UserRole
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pairs: list[CardPair] = []
+        self._included = 0  # running count of pairs with included=True
+        self._rows_by_path: dict[str, list[int]] = {}  # image path -> rows, ascending
+
+        # Thumbnails are decoded on demand, off the GUI thread, into a small LRU
+        self._thumbs: OrderedDict[str, QPixmap] = OrderedDict()
+        self._loading: set[str] = set()
+        self._thumb_pool = QThreadPool(self)
+        self._thumb_pool.setMaxThreadCount(os.cpu_count() or 2)
+        self._thumb_signals = _ThumbSignals(self)
+        self._thumb_signals.loaded.connect(self._on_thumb_loaded)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._pairs)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        pair = self._pairs[index.row()]
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return pair.transcript_text
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if pair.included else Qt.Unchecked
+        if role == Qt.DecorationRole:
+            return self._thumb(pair.image_path)
+        if role == self.PairRole:
+            return pair
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        pair = self._pairs[index.row()]
+        if role == Qt.CheckStateRole:
+            included = Qt.CheckState(value) == Qt.Checked
+            if included != pair.included:
+                self._included += 1 if included else -1
+            pair.included = included
+        elif role == Qt.EditRole:
+            pair.transcript_text = value
         else:
-            self.thumb_label.setText("(no image)")
-            self.thumb_label.setAlignment(Qt.AlignCenter)
-        self.thumb_label.mousePressEvent = self._show_full_image
-        layout.addWidget(self.thumb_label)
-
-        # Text + info
-        text_layout = QVBoxLayout()
-        time_label = QLabel(f"Slide #{self._index + 1} @ {self.pair.slide_timestamp:.1f}s")
-        time_label.setStyleSheet("font-weight: bold; font-size: 12px;")
-        text_layout.addWidget(time_label)
-
-        self.text_edit = QPlainTextEdit()
-        self.text_edit.setPlainText(self.pair.transcript_text)
-        self.text_edit.setMaximumHeight(120)
-        self.text_edit.textChanged.connect(self._on_text_changed)
-        text_layout.addWidget(self.text_edit)
-        layout.addLayout(text_layout, stretch=1)
-
-        # Delete button
-        btn_delete = QPushButton("Delete")
-        btn_delete.setObjectName("danger")
-        btn_delete.setFixedWidth(70)
-        btn_delete.clicked.connect(lambda: self.deleted.emit(self))
-        layout.addWidget(btn_delete, alignment=Qt.AlignTop)
-
-    def _on_text_changed(self):
-        self.pair.transcript_text = self.text_edit.toPlainText()
-
-    def _show_full_image(self, _event):
-        dialog = ImageDialog(self.pair.image_path, self)
-        dialog.exec()
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable | Qt.ItemIsUserCheckable
+
+    def _thumb(self, path: str):
+        """Cached thumbnail for path, or None while it is still being decoded."""
+        pixmap = self._thumbs.get(path)
+        if pixmap is not None:
+            self._thumbs.move_to_end(path)
+            return pixmap
+        if path not in self._loading:
+            self._loading.add(path)
+            self._thumb_pool.start(ThumbLoader(path, self._thumb_signals))
+        return None
+
+    def _on_thumb_loaded(self, path: str, image: QImage):
+        self._loading.discard(path)
+        self._thumbs[path] = QPixmap.fromImage(image)
+        if len(self._thumbs) > _THUMB_CACHE_SIZE:
+            self._thumbs.popitem(last=False)
+        # Repaint only the cards showing this image, one signal per run of rows
+        for first, last in _row_runs(self._rows_by_path.get(path, ())):
+            self.dataChanged.emit(self.index(first), self.index(last), [Qt.DecorationRole])
+
+    def _index_rows(self, start: int = 0):
+        """Add rows from start onwards to the image path index."""
+        if start == 0:
+            self._rows_by_path.clear()
+        for row in range(start, len(self._pairs)):
+            self._rows_by_path.setdefault(self._pairs[row].image_path, []).append(row)
+
+    def pairs(self) -> list[CardPair]:
+        return self._pairs
+
+    def included_count(self) -> int:
+        return self._included
+
+    def set_pairs(self, pairs: list[CardPair]):
+        self.beginResetModel()
+        self._pairs = list(pairs)
+        self._included = sum(p.included for p in self._pairs)
+        self._index_rows()
+        self.endResetModel()
+
+    def append_pairs(self, pairs: list[CardPair]):
+        if not pairs:
+            return
+        start = len(self._pairs)
+        self.beginInsertRows(QModelIndex(), start, start + len(pairs) - 1)
+        self._pairs.extend(pairs)
+        self._included += sum(p.included for p in pairs)
+        self._index_rows(start)
+        self.endInsertRows()
+
+    def remove_rows(self, rows: list[int]):
+        # Remove contiguous runs as one slice each, highest first so earlier
+        # removals don't shift the rows still to be removed
+        runs = _row_runs(sorted(set(rows)))
+        for first, last in reversed(runs):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            self._included -= sum(p.included for p in self._pairs[first:last + 1])
+            del self._pairs[first:last + 1]
+            self.endRemoveRows()
+        if runs:
+            # Later rows shifted up; renumber the path index
+            self._index_rows()
+
+    def set_all_included(self, included: bool):
+        if not self._pairs:
+            return
+        for pair in self._pairs:
+            pair.included = included
+        self._included = len(self._pairs) if included else 0
+        self.dataChanged.emit(self.index(0), self.index(len(self._pairs) - 1), [Qt.CheckStateRole])
+
+
+class CardDelegate(QStyledItemDelegate):
+    """Paints a card row (checkbox, thumbnail, title, transcript) on demand.
+
+    Only the row being edited gets a real QPlainTextEdit.
+    """
+
+    image_clicked = Signal(str)  # image path
+
+    @staticmethod
+    def _check_rect(rect: QRect) -> QRect:
+        return QRect(rect.left() + _MARGIN, rect.center().y() - 8, 16, 16)
+
+    @staticmethod
+    def _thumb_rect(rect: QRect) -> QRect:
+        return QRect(rect.left() + _MARGIN + _CHECK_W, rect.top() + _MARGIN, _THUMB_W, _THUMB_H)
+
+    @staticmethod
+    def _text_rect(rect: QRect, title_h: int) -> QRect:
+        left = rect.left() + _MARGIN + _CHECK_W + _THUMB_W + 6
+        top = rect.top() + _MARGIN + title_h + 4
+        return QRect(left, top, max(0, rect.right() - _MARGIN - left), _TEXT_MAX_H)
+
+    def sizeHint(self, option, index):
+        # Width follows the viewport; the transcript wraps inside it
+        return QSize(0, _THUMB_H + 2 * _MARGIN)
+
+    def paint(self, painter, option, index):
+        pair = index.data(CardListModel.PairRole)
+        widget = option.widget
+        style = widget.style() if widget else None
+        rect = option.rect
+        painter.save()
+
+        if option.state & QStyle.State_Selected:
+            highlight = option.palette.highlight().color()
+            highlight.setAlpha(60)
+            painter.fillRect(rect, highlight)
+
+        check = QStyleOptionButton()
+        check.rect = self._check_rect(rect)
+        check.state = QStyle.State_Enabled | (QStyle.State_On if pair.included else QStyle.State_Off)
+        if style:
+            style.drawPrimitive(QStyle.PE_IndicatorCheckBox, check, painter, widget)
+
+        thumb_rect = self._thumb_rect(rect)
+        pixmap = index.data(Qt.DecorationRole)
+        painter.setPen(option.palette.text().color())
+        if pixmap is None:
+            painter.drawText(thumb_rect, Qt.AlignCenter, "Loading...")
+        elif not pixmap.isNull():
+            x = thumb_rect.left() + (_THUMB_W - pixmap.width()) // 2
+            y = thumb_rect.top() + (_THUMB_H - pixmap.height()) // 2
+            painter.drawPixmap(x, y, pixmap)
+        else:
+            painter.drawText(thumb_rect, Qt.AlignCenter, "(no image)")
+
+        title_font = painter.font()
+        title_font.setBold(True)
+        painter.setFont(title_font)
+        title_h = painter.fontMetrics().height()
+        title_rect = QRect(thumb_rect.right() + 7, rect.top() + _MARGIN,
+                           max(0, rect.right() - _MARGIN - thumb_rect.right() - 7), title_h)
+        painter.drawText(title_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                         f"Slide #{index.row() + 1} @ {pair.slide_timestamp:.1f}s")
+
+        painter.setFont(option.font)
+        text_rect = self._text_rect(rect, title_h)
+        painter.setPen(option.palette.mid().color())
+        painter.drawRect(text_rect.adjusted(0, 0, -1, -1))
+        painter.setPen(option.palette.text().color())
+        painter.setClipRect(text_rect)
+        painter.drawText(text_rect.adjusted(4, 4, -4, -4), Qt.TextWordWrap, pair.transcript_text)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            pos = event.position().toPoint()
+            if self._check_rect(option.rect).adjusted(-4, -4, 4, 4).contains(pos):
+                state = index.data(Qt.CheckStateRole)
+                new_state = Qt.Unchecked if state == Qt.Checked else Qt.Checked
+                return model.setData(index, new_state, Qt.CheckStateRole)
+            if self._thumb_rect(option.rect).contains(pos):
+                self.image_clicked.emit(index.data(CardListModel.PairRole).image_path)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def createEditor(self, parent, option, index):
+        editor = QPlainTextEdit(parent)
+        editor.setTabChangesFocus(True)
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.setPlainText(index.data(Qt.EditRole))
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.toPlainText(), Qt.EditRole)
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(self._text_rect(option.rect, option.fontMetrics.height()))
 
 
 class ReviewPanel(QWidget):
-    """Scrollable list of card pairs for review and editing."""
+    """Virtualized list of card pairs for review and editing."""
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._card_widgets: list[CardWidget] = []
-        self._pairs: list[CardPair] = []
         self._setup_ui()
 
     def _setup_ui(self):
@@ -126,11 +368,11 @@ class ReviewPanel(QWidget):
         controls.addStretch()
 
         self.btn_select_all = QPushButton("Select All")
-        self.btn_select_all.clicked.connect(lambda: self._set_all_checked(True))
+        self.btn_select_all.clicked.connect(self._select_all)
         controls.addWidget(self.btn_select_all)
 
         self.btn_deselect_all = QPushButton("Deselect All")
-        self.btn_deselect_all.clicked.connect(lambda: self._set_all_checked(False))
+        self.btn_deselect_all.clicked.connect(self._deselect_all)
         controls.addWidget(self.btn_deselect_all)
 
         self.btn_export = QPushButton("Export to Anki")
@@ -138,65 +380,65 @@ class ReviewPanel(QWidget):
         controls.addWidget(self.btn_export)
         outer.addLayout(controls)
 
-        # Scroll area for cards
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll_content = QWidget()
-        self.scroll_layout = QVBoxLayout(self.scroll_content)
-        self.scroll_layout.setAlignment(Qt.AlignTop)
-        self.scroll.setWidget(self.scroll_content)
-        outer.addWidget(self.scroll)
+        # Card list: rows are painted by the delegate, so only visible cards cost anything
+        self.model = CardListModel(self)
+        self.delegate = CardDelegate(self)
+        self.delegate.image_clicked.connect(self._show_full_image)
+
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setItemDelegate(self.delegate)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSpacing(2)
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.list_view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.list_view.setEditTriggers(
+            QAbstractItemView.DoubleClicked | QAbstractItemView.SelectedClicked
+            | QAbstractItemView.EditKeyPressed
+        )
+        self.list_view.setToolTip("Double-click a card to edit its text; right-click to delete")
+
+        # Delete via context menu or the Delete key
+        action_delete = QAction("Delete", self.list_view)
+        action_delete.setShortcut(QKeySequence.Delete)
+        action_delete.setShortcutContext(Qt.WidgetShortcut)
+        action_delete.triggered.connect(self._delete_selected)
+        self.list_view.addAction(action_delete)
+        self.list_view.setContextMenuPolicy(Qt.ActionsContextMenu)
+        outer.addWidget(self.list_view)
+
+        self.model.dataChanged.connect(self._update_count)
+        self.model.rowsInserted.connect(self._update_count)
+        self.model.rowsRemoved.connect(self._update_count)
+        self.model.modelReset.connect(self._update_count)
 
     def load_pairs(self, pairs: list[CardPair]):
         """Replace the current display with new card pairs."""
-        self._pairs = pairs
-        self._clear_cards()
-
-        for i, pair in enumerate(pairs):
-            card = CardWidget(pair, i)
-            card.deleted.connect(self._on_card_deleted)
-            self.scroll_layout.addWidget(card)
-            self._card_widgets.append(card)
-
-        self._update_count()
-        self.btn_export.setEnabled(len(pairs) > 0)
+        self.model.set_pairs(pairs)
 
     def add_pairs(self, pairs: list[CardPair]):
         """Append new card pairs to the existing display."""
-        start_idx = len(self._pairs)
-        self._pairs.extend(pairs)
+        self.model.append_pairs(pairs)
 
-        for i, pair in enumerate(pairs):
-            card = CardWidget(pair, start_idx + i)
-            card.deleted.connect(self._on_card_deleted)
-            self.scroll_layout.addWidget(card)
-            self._card_widgets.append(card)
+    def get_included_pairs(self) -> list[CardPair]:
+        return [p for p in self.model.pairs() if p.included]
 
-        self._update_count()
-        self.btn_export.setEnabled(len(self._pairs) > 0)
+    def _delete_selected(self):
+        rows = [idx.row() for idx in self.list_view.selectionModel().selectedRows()]
+        self.model.remove_rows(rows)
 
-    def get_included_pairs(self) -> list[CardPair]:
-        return [p for p in self._pairs if p.included]
-
-    def _on_card_deleted(self, card_widget: CardWidget):
-        self._pairs.remove(card_widget.pair)
-        self._card_widgets.remove(card_widget)
-        self.scroll_layout.removeWidget(card_widget)
-        card_widget.deleteLater()
-        self._update_count()
-
-    def _set_all_checked(self, checked: bool):
-        for card in self._card_widgets:
-            card.checkbox.setChecked(checked)
-
-    def _clear_cards(self):
-        for card in self._card_widgets:
-            self.scroll_layout.removeWidget(card)
-            card.deleteLater()
-        self._card_widgets.clear()
-
-    def _update_count(self):
-        n = len(self._pairs)
-        included = sum(1 for p in self._pairs if p.included)
-        self.label_count.setText(f"{included}/{n} cards selected")
+    def _show_full_image(self, image_path: str):
+        dialog = ImageDialog(image_path, self)
+        dialog.exec()
+
+    def _select_all(self):
+        self.model.set_all_included(True)
+
+    def _deselect_all(self):
+        self.model.set_all_included(False)
+
+    def _update_count(self, *_args):
+        n = self.model.rowCount()
+        self.label_count.setText(f"{self.model.included_count()}/{n} cards selected")
         self.btn_export.setEnabled(n > 0)
@@ -1,5 +1,6 @@
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QStringListModel, Qt, QTimer, Signal, Slot
 from PySide6.QtWidgets import (
+    QApplication,
     QCheckBox,
     QComboBox,
     QDoubleSpinBox,
@@ -12,40 +13,81 @@ from PySide6.QtWidgets import (
     QPushButton,
     QSlider,
     QSpinBox,
-    QVBoxLayout,
     QWidget,
 )
 
+WHISPER_MODELS = ("tiny", "base", "small", "medium", "large-v3")
+COMPUTE_TYPES = ("int8", "int16", "float32")
+LANGUAGES = ("auto", "es", "en", "pt", "fr", "de")
 
-class SettingsPanel(QWidget):
+# One read-only list model per choice tuple, shared by every panel instance.
+# Parented to the application so it outlives the panels that display it.
+_shared_models: dict = {}
+
+
+def _shared_model(items: tuple) -> QStringListModel:
+    model = _shared_models.get(items)
+    if model is None:
+        model = QStringListModel(list(items), QApplication.instance())
+        _shared_models[items] = model
+    return model
+
+
+# Skip custom icon lookups and symlink resolution when listing folders;
+# both stat every entry and stall on network mounts
+_DIR_DIALOG_OPTS = (
+    QFileDialog.Option.ShowDirsOnly
+    | QFileDialog.Option.DontUseCustomDirectoryIcons
+    | QFileDialog.Option.DontResolveSymlinks
+)
+
+# Slider ticks 50..99 map to these labels; index with value - 50
+_SSIM_LABELS = tuple(f"{i / 100:.2f}" for i in range(50, 100))
+
+
+class SettingsPanel(QGroupBox):
     settings_changed = Signal()
 
     def __init__(self, settings: dict, parent=None):
-        super().__init__(parent)
-        self._setup_ui(settings)
+        super().__init__("Settings", parent)
+        # settings_changed fires once per burst of edits, 150 ms after the last
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(150)
+        self._emit_timer.timeout.connect(self.settings_changed)
+        # Painting is suspended while the window is being resized and
+        # resumes once the size has been stable for 50 ms
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._end_resize)
+        # No repaints while the form is assembled; change signals are only
+        # connected after every widget holds its initial value
+        self.setUpdatesEnabled(False)
+        try:
+            self._setup_ui(settings)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _setup_ui(self, s: dict):
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        group = QGroupBox("Settings")
-        form = QFormLayout(group)
+        # The panel is the group box itself; the form sits directly on it
+        form = QFormLayout(self)
 
         # Whisper model
-        self.model_combo = QComboBox()
-        self.model_combo.addItems(["tiny", "base", "small", "medium", "large-v3"])
+        self.model_combo = self._make_combo(WHISPER_MODELS)
         self.model_combo.setCurrentText(s.get("whisper_model", "large-v3"))
         form.addRow("Whisper Model:", self.model_combo)
 
         # Compute type
-        self.compute_combo = QComboBox()
-        self.compute_combo.addItems(["int8", "int16", "float32"])
+        self.compute_combo = self._make_combo(COMPUTE_TYPES)
         self.compute_combo.setCurrentText(s.get("compute_type", "int8"))
         self.compute_combo.setToolTip("int8 is fastest on CPU, float32 is most accurate")
         form.addRow("Compute Type:", self.compute_combo)
 
-        # SSIM threshold
-        ssim_row = QHBoxLayout()
+        # SSIM threshold (slider + value label as one form field)
+        ssim_field = QWidget()
+        ssim_row = QHBoxLayout(ssim_field)
+        ssim_row.setContentsMargins(0, 0, 0, 0)
         self.ssim_slider = QSlider(Qt.Horizontal)
         self.ssim_slider.setRange(50, 99)
         self.ssim_slider.setValue(int(s.get("ssim_threshold", 0.85) * 100))
@@ -53,13 +95,18 @@ class SettingsPanel(QWidget):
             "Lower = more sensitive to changes (detects more slides).\n"
             "Higher = less sensitive (only major changes trigger a new slide)."
         )
-        self.ssim_label = QLabel(f"{self.ssim_slider.value() / 100:.2f}")
-        self.ssim_slider.valueChanged.connect(
-            lambda v: self.ssim_label.setText(f"{v / 100:.2f}")
-        )
+        self.ssim_label = QLabel(_SSIM_LABELS[self.ssim_slider.value() - 50])
+        # Coalesce drag ticks into one label update per 30 ms
+        self._pending_ssim = self.ssim_slider.value()
+        self._ssim_timer = QTimer(self)
+        self._ssim_timer.setSingleShot(True)
+        self._ssim_timer.setInterval(30)
+        self._ssim_timer.timeout.connect(self._show_ssim)
+        self.ssim_slider.valueChanged.connect(self._on_ssim_changed)
+        self.ssim_slider.sliderReleased.connect(self._show_ssim)
         ssim_row.addWidget(self.ssim_slider)
         ssim_row.addWidget(self.ssim_label)
-        form.addRow("SSIM Threshold:", ssim_row)
+        form.addRow("SSIM Threshold:", ssim_field)
 
         # Frame interval
         self.frame_interval = QDoubleSpinBox()
@@ -70,6 +117,12 @@ class SettingsPanel(QWidget):
         self.frame_interval.setToolTip("How often to sample frames for slide detection")
         form.addRow("Frame Interval:", self.frame_interval)
 
+        # GPU slide detection
+        self.cuda_check = QCheckBox("Use CUDA GPU for slide detection")
+        self.cuda_check.setChecked(s.get("use_cuda", False))
+        self.cuda_check.setToolTip("Requires PyTorch with CUDA; falls back to CPU when unavailable")
+        form.addRow(self.cuda_check)
+
         # Matching window
         self.matching_window = QSpinBox()
         self.matching_window.setRange(3, 30)
@@ -87,8 +140,7 @@ class SettingsPanel(QWidget):
         form.addRow("Pre-context:", self.pre_context)
 
         # Language
-        self.lang_combo = QComboBox()
-        self.lang_combo.addItems(["auto", "es", "en", "pt", "fr", "de"])
+        self.lang_combo = self._make_combo(LANGUAGES)
         self.lang_combo.setCurrentText(s.get("language", "auto"))
         form.addRow("Language:", self.lang_combo)
 
@@ -102,10 +154,15 @@ class SettingsPanel(QWidget):
         self.api_key_input.setPlaceholderText("sk-ant-...")
         self.api_key_input.setEchoMode(QLineEdit.Password)
         self.api_key_input.setText(s.get("anthropic_api_key", ""))
+        # Keys are plain ASCII: no input-method pre-edit, no extra text margins
+        self.api_key_input.setAttribute(Qt.WA_InputMethodEnabled, False)
+        self.api_key_input.setTextMargins(0, 0, 0, 0)
         form.addRow("Anthropic API Key:", self.api_key_input)
 
-        # Output directory
-        out_row = QHBoxLayout()
+        # Output directory (line edit + browse button as one form field)
+        out_field = QWidget()
+        out_row = QHBoxLayout(out_field)
+        out_row.setContentsMargins(0, 0, 0, 0)
         self.output_dir = QLineEdit()
         self.output_dir.setPlaceholderText("Select output directory...")
         self.output_dir.setText(s.get("output_directory", ""))
@@ -113,31 +170,93 @@ class SettingsPanel(QWidget):
         self.btn_browse.clicked.connect(self._browse_output)
         out_row.addWidget(self.output_dir)
         out_row.addWidget(self.btn_browse)
-        form.addRow("Output Directory:", out_row)
+        form.addRow("Output Directory:", out_field)
 
         # Dark mode
         self.dark_mode_check = QCheckBox("Dark Mode")
         self.dark_mode_check.setChecked(s.get("dark_mode", False))
         form.addRow(self.dark_mode_check)
 
-        layout.addWidget(group)
+        # Spin boxes report a value once it is committed (Enter, focus-out,
+        # arrows), not on every typed digit
+        self._spins = (self.frame_interval, self.matching_window, self.pre_context)
+        for spin in self._spins:
+            spin.setKeyboardTracking(False)
+            spin.setAccelerated(True)
+
+        for sig in (
+            self.model_combo.currentTextChanged,
+            self.compute_combo.currentTextChanged,
+            self.ssim_slider.valueChanged,
+            self.frame_interval.valueChanged,
+            self.cuda_check.toggled,
+            self.matching_window.valueChanged,
+            self.pre_context.valueChanged,
+            self.lang_combo.currentTextChanged,
+            self.llm_check.toggled,
+            self.api_key_input.textChanged,
+            self.output_dir.textChanged,
+            self.dark_mode_check.toggled,
+        ):
+            sig.connect(self._schedule_emit)
+
+        # (key, bound getter) pairs read by get_settings
+        self._getters = (
+            ("whisper_model", self.model_combo.currentText),
+            ("compute_type", self.compute_combo.currentText),
+            ("ssim_threshold", lambda: self.ssim_slider.value() / 100.0),
+            ("frame_interval", self.frame_interval.value),
+            ("use_cuda", self.cuda_check.isChecked),
+            ("matching_window", self.matching_window.value),
+            ("pre_context_seconds", self.pre_context.value),
+            ("language", self.lang_combo.currentText),
+            ("use_llm_correction", self.llm_check.isChecked),
+            ("anthropic_api_key", self.api_key_input.text),
+            ("output_directory", self.output_dir.text),
+            ("dark_mode", self.dark_mode_check.isChecked),
+        )
+
+    def resizeEvent(self, event):
+        if self.updatesEnabled():
+            self.setUpdatesEnabled(False)
+        self._resize_timer.start()
+        super().resizeEvent(event)
+
+    @Slot()
+    def _end_resize(self):
+        self.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _make_combo(items: tuple) -> QComboBox:
+        """Combo backed by the shared model for items instead of per-item inserts."""
+        combo = QComboBox()
+        combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        combo.setModel(_shared_model(items))
+        return combo
+
+    def _schedule_emit(self, *_):
+        self._emit_timer.start()
+
+    @Slot(int)
+    def _on_ssim_changed(self, v: int):
+        self._pending_ssim = v
+        if not self._ssim_timer.isActive():
+            self._ssim_timer.start()
+
+    @Slot()
+    def _show_ssim(self):
+        self._ssim_timer.stop()
+        self.ssim_label.setText(_SSIM_LABELS[self._pending_ssim - 50])
 
     def _browse_output(self):
-        folder = QFileDialog.getExistingDirectory(self, "Select Output Directory", self.output_dir.text())
+        folder = QFileDialog.getExistingDirectory(
+            self, "Select Output Directory", self.output_dir.text(), _DIR_DIALOG_OPTS
+        )
         if folder:
             self.output_dir.setText(folder)
 
     def get_settings(self) -> dict:
-        return {
-            "whisper_model": self.model_combo.currentText(),
-            "compute_type": self.compute_combo.currentText(),
-            "ssim_threshold": self.ssim_slider.value() / 100.0,
-            "frame_interval": self.frame_interval.value(),
-            "matching_window": self.matching_window.value(),
-            "pre_context_seconds": self.pre_context.value(),
-            "language": self.lang_combo.currentText(),
-            "use_llm_correction": self.llm_check.isChecked(),
-            "anthropic_api_key": self.api_key_input.text(),
-            "output_directory": self.output_dir.text(),
-            "dark_mode": self.dark_mode_check.isChecked(),
-        }
+        # Commit digits still being typed into a spin box
+        for spin in self._spins:
+            spin.interpretText()
+        return {key: get() for key, get in self._getters}
@@ -1,12 +1,13 @@
-LIGHT_STYLE = """
+from PySide6.QtGui import QColor, QPalette
+
+# Geometry, fonts and accent colors shared by both themes. Applied after the
+# theme colors: rules of equal specificity resolve by order.
+BASE_STYLE = """
 QMainWindow, QWidget {
-    background-color: #f5f5f5;
-    color: #1a1a1a;
     font-family: "Segoe UI", Arial, sans-serif;
     font-size: 13px;
 }
 QGroupBox {
-    border: 1px solid #d0d0d0;
     border-radius: 6px;
     margin-top: 12px;
     padding-top: 16px;
@@ -25,27 +26,15 @@ QPushButton {
     padding: 6px 16px;
     font-weight: 500;
 }
-QPushButton:hover {
-    background-color: #106ebe;
-}
 QPushButton:pressed {
     background-color: #005a9e;
 }
-QPushButton:disabled {
-    background-color: #c0c0c0;
-    color: #808080;
-}
 QPushButton#danger {
     background-color: #d13438;
 }
-QPushButton#danger:hover {
-    background-color: #a4262c;
-}
 QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {
-    border: 1px solid #c0c0c0;
     border-radius: 4px;
     padding: 4px 8px;
-    background-color: white;
 }
 QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {
     border-color: #0078d4;
@@ -53,7 +42,6 @@ QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {
 QSlider::groove:horizontal {
     border: none;
     height: 4px;
-    background: #c0c0c0;
     border-radius: 2px;
 }
 QSlider::handle:horizontal {
@@ -64,7 +52,6 @@ QSlider::handle:horizontal {
     border-radius: 8px;
 }
 QProgressBar {
-    border: 1px solid #d0d0d0;
     border-radius: 4px;
     text-align: center;
     height: 20px;
@@ -73,6 +60,49 @@ QProgressBar::chunk {
     background-color: #0078d4;
     border-radius: 3px;
 }
+QHeaderView::section {
+    padding: 6px;
+    font-weight: bold;
+}
+QScrollArea {
+    border: none;
+}
+QCheckBox::indicator {
+    width: 16px;
+    height: 16px;
+}
+QPlainTextEdit#log {
+    font-family: "Consolas", "Courier New", monospace;
+    font-size: 11px;
+}
+"""
+
+# Theme-specific colors the palette can't express (borders, hover and
+# disabled states, per-widget backgrounds), placed before BASE_STYLE
+LIGHT_COLORS = """
+QGroupBox {
+    border: 1px solid #d0d0d0;
+}
+QPushButton:hover {
+    background-color: #106ebe;
+}
+QPushButton:disabled {
+    background-color: #c0c0c0;
+    color: #808080;
+}
+QPushButton#danger:hover {
+    background-color: #a4262c;
+}
+QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {
+    border: 1px solid #c0c0c0;
+    background-color: white;
+}
+QSlider::groove:horizontal {
+    background: #c0c0c0;
+}
+QProgressBar {
+    border: 1px solid #d0d0d0;
+}
 QTableWidget {
     border: 1px solid #d0d0d0;
     gridline-color: #e0e0e0;
@@ -87,106 +117,41 @@ QHeaderView::section {
     background-color: #e8e8e8;
     border: none;
     border-bottom: 1px solid #d0d0d0;
-    padding: 6px;
-    font-weight: bold;
 }
 QStatusBar {
     background-color: #e8e8e8;
     border-top: 1px solid #d0d0d0;
 }
-QScrollArea {
-    border: none;
-}
-QCheckBox::indicator {
-    width: 16px;
-    height: 16px;
-}
 """
 
-DARK_STYLE = """
-QMainWindow, QWidget {
-    background-color: #1e1e1e;
-    color: #d4d4d4;
-    font-family: "Segoe UI", Arial, sans-serif;
-    font-size: 13px;
-}
+DARK_COLORS = """
 QGroupBox {
     border: 1px solid #3c3c3c;
-    border-radius: 6px;
-    margin-top: 12px;
-    padding-top: 16px;
-    font-weight: bold;
     color: #d4d4d4;
 }
-QGroupBox::title {
-    subcontrol-origin: margin;
-    left: 12px;
-    padding: 0 6px;
-}
-QPushButton {
-    background-color: #0078d4;
-    color: white;
-    border: none;
-    border-radius: 4px;
-    padding: 6px 16px;
-    font-weight: 500;
-}
 QPushButton:hover {
     background-color: #1a8ad4;
 }
-QPushButton:pressed {
-    background-color: #005a9e;
-}
 QPushButton:disabled {
     background-color: #3c3c3c;
     color: #666666;
 }
-QPushButton#danger {
-    background-color: #d13438;
-}
 QPushButton#danger:hover {
     background-color: #e04448;
 }
 QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {
     border: 1px solid #3c3c3c;
-    border-radius: 4px;
-    padding: 4px 8px;
     background-color: #2d2d2d;
     color: #d4d4d4;
 }
-QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBox:focus {
-    border-color: #0078d4;
-}
-QComboBox QAbstractItemView {
-    background-color: #2d2d2d;
-    color: #d4d4d4;
-    selection-background-color: #0078d4;
-}
 QSlider::groove:horizontal {
-    border: none;
-    height: 4px;
     background: #3c3c3c;
-    border-radius: 2px;
-}
-QSlider::handle:horizontal {
-    background: #0078d4;
-    width: 16px;
-    height: 16px;
-    margin: -6px 0;
-    border-radius: 8px;
 }
 QProgressBar {
     border: 1px solid #3c3c3c;
-    border-radius: 4px;
-    text-align: center;
-    height: 20px;
     background-color: #2d2d2d;
     color: #d4d4d4;
 }
-QProgressBar::chunk {
-    background-color: #0078d4;
-    border-radius: 3px;
-}
 QTableWidget {
     border: 1px solid #3c3c3c;
     gridline-color: #3c3c3c;
@@ -202,8 +167,6 @@ QHeaderView::section {
     background-color: #333333;
     border: none;
     border-bottom: 1px solid #3c3c3c;
-    padding: 6px;
-    font-weight: bold;
     color: #d4d4d4;
 }
 QStatusBar {
@@ -211,12 +174,10 @@ QStatusBar {
     border-top: 1px solid #3c3c3c;
     color: #d4d4d4;
 }
-QScrollArea {
-    border: none;
-}
-QCheckBox::indicator {
-    width: 16px;
-    height: 16px;
+QComboBox QAbstractItemView {
+    background-color: #2d2d2d;
+    color: #d4d4d4;
+    selection-background-color: #0078d4;
 }
 QToolTip {
     background-color: #2d2d2d;
@@ -226,6 +187,66 @@ QToolTip {
 }
 """
 
+LIGHT_STYLE = LIGHT_COLORS + BASE_STYLE
+DARK_STYLE = DARK_COLORS + BASE_STYLE
+
+
+# Base window/text colors per theme. Set as the app palette rather than a
+# catch-all QWidget rule, so scroll bars, check indicators and delegates that
+# read option.palette follow the theme too.
+LIGHT_PALETTE = {
+    QPalette.Window: "#f5f5f5",
+    QPalette.WindowText: "#1a1a1a",
+    QPalette.Base: "#ffffff",
+    QPalette.AlternateBase: "#f9f9f9",
+    QPalette.Text: "#1a1a1a",
+    QPalette.Button: "#e8e8e8",
+    QPalette.ButtonText: "#1a1a1a",
+    QPalette.Mid: "#c0c0c0",
+    QPalette.Highlight: "#0078d4",
+    QPalette.HighlightedText: "#ffffff",
+    QPalette.ToolTipBase: "#ffffff",
+    QPalette.ToolTipText: "#1a1a1a",
+    QPalette.PlaceholderText: "#808080",
+}
+
+DARK_PALETTE = {
+    QPalette.Window: "#1e1e1e",
+    QPalette.WindowText: "#d4d4d4",
+    QPalette.Base: "#2d2d2d",
+    QPalette.AlternateBase: "#252525",
+    QPalette.Text: "#d4d4d4",
+    QPalette.Button: "#333333",
+    QPalette.ButtonText: "#d4d4d4",
+    QPalette.Mid: "#3c3c3c",
+    QPalette.Highlight: "#0078d4",
+    QPalette.HighlightedText: "#ffffff",
+    QPalette.ToolTipBase: "#2d2d2d",
+    QPalette.ToolTipText: "#d4d4d4",
+    QPalette.PlaceholderText: "#808080",
+}
+
+# Theme currently applied to the QApplication, None before the first apply
+_applied_dark = None
+
 
 def get_style(dark_mode: bool = False) -> str:
     return DARK_STYLE if dark_mode else LIGHT_STYLE
+
+
+def get_palette(dark_mode: bool = False) -> QPalette:
+    palette = QPalette()
+    for role, color in (DARK_PALETTE if dark_mode else LIGHT_PALETTE).items():
+        palette.setColor(role, QColor(color))
+    return palette
+
+
+def apply_style(app, dark_mode: bool) -> None:
+    """Set the app-wide palette and stylesheet, skipping the re-polish if already active."""
+    global _applied_dark
+    if dark_mode == _applied_dark:
+        return
+    _applied_dark = dark_mode
+    # Palette first, so the stylesheet re-polish picks it up in the same pass
+    app.setPalette(get_palette(dark_mode))
+    app.setStyleSheet(get_style(dark_mode))
@@ -1,16 +1,35 @@
 import sys
 
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QGuiApplication
 from PySide6.QtWidgets import QApplication
 
-from framedx.gui.main_window import MainWindow
+from framedx.config.settings import load_settings
+from framedx.gui.styles import apply_style
 
 
 def main():
+    # Process-wide flags must be set before the application object exists.
+    # Bursts of mouse-move/wheel/tablet events collapse into one, so sliders
+    # and spin boxes don't relayout per intermediate event.
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
+    QApplication.setAttribute(Qt.AA_CompressTabletEvents, True)
+    QGuiApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+
     app = QApplication(sys.argv)
     app.setApplicationName("FrameDX")
     app.setOrganizationName("FrameDX")
+    # Steady text cursor: a blinking one repaints the focused editor twice a second
+    app.setCursorFlashTime(0)
+
+    # Style the app before any widget exists, so each widget is polished once
+    settings = load_settings()
+    apply_style(app, settings.get("dark_mode", False))
+
+    # Imported after QApplication exists; it pulls in the whole GUI and core
+    from framedx.gui.main_window import MainWindow
 
-    window = MainWindow()
+    window = MainWindow(settings)
     window.show()
 
     sys.exit(app.exec())
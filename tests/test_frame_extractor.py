@@ -0,0 +1,47 @@
+import shutil
+
+import cv2
+import numpy as np
+import pytest
+
+from framedx.core.frame_extractor import extract_slides
+
+pytestmark = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not on PATH")
+
+_FPS = 10
+_SIZE = (320, 240)
+
+
+def _slide(seed: int) -> np.ndarray:
+    """A distinct blocky pattern, so consecutive slides score well below 0.85."""
+    rng = np.random.default_rng(seed)
+    blocks = rng.integers(0, 256, (6, 8, 3), dtype=np.uint8)
+    return cv2.resize(blocks, _SIZE, interpolation=cv2.INTER_NEAREST)
+
+
+def _write_clip(path: str, cuts: list[tuple[float, float]]) -> list[np.ndarray]:
+    """Write one slide per (start, end) span; returns the slide images."""
+    slides = [_slide(i) for i in range(len(cuts))]
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), _FPS, _SIZE)
+    for img, (start, end) in zip(slides, cuts):
+        for _ in range(round((end - start) * _FPS)):
+            writer.write(img)
+    writer.release()
+    return slides
+
+
+def test_saved_slides_match_their_timestamps(tmp_path):
+    # The short slide at 6.5-8.5 s only shows up in the 8 s sample; a scan
+    # sampling half an interval late skips it and saves slide 0 twice.
+    cuts = [(0.0, 6.5), (6.5, 8.5), (8.5, 14.0), (14.0, 20.0)]
+    clip = str(tmp_path / "cuts.avi")
+    images = _write_clip(clip, cuts)
+
+    found = extract_slides(clip, str(tmp_path / "out"), frame_interval=2.0)
+
+    assert [s.timestamp for s in found] == [6.0, 8.0, 12.0]
+    # Each saved PNG is the slide that was on screen at its timestamp
+    for i, slide in enumerate(found):
+        saved = cv2.imread(slide.image_path).astype(int)
+        diffs = [np.abs(saved - img.astype(int)).mean() for img in images]
+        assert int(np.argmin(diffs)) == i